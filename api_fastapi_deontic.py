@@ -17,16 +17,34 @@ Key Features:
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator, model_validator
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from falkordb import FalkorDB
+import redis
 import logging
 from pathlib import Path
+import asyncio
+import hashlib
 import json
-from functools import lru_cache
+import os
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, islice
+import heapq
+import sys
 import time
 
+try:
+    import ahocorasick  # optional (pyahocorasick): multi-keyword health scan
+except ImportError:
+    ahocorasick = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -35,60 +53,203 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 # Valid case statuses for search (others are skipped)
-VALID_CASE_STATUSES = ['Completed', 'Complete', 'Active', 'Published']
+VALID_CASE_STATUSES = ('Completed', 'Complete', 'Active', 'Published')
+VALID_CASE_STATUSES_SET = frozenset(VALID_CASE_STATUSES)
+
+# Personal data category values that mean "no PII" (compared upper-cased and
+# trimmed); also passed to Cypher as $pii_na_values so both sides agree
+PII_NA_VALUES = frozenset(['N/A', 'NA', 'NULL', ''])
+
+# Query parameter forms of the constants above, built once at import
+# (the graph client serializes lists)
+VALID_CASE_STATUSES_PARAM = list(VALID_CASE_STATUSES)
+PII_NA_VALUES_PARAM = sorted(PII_NA_VALUES)
+
+# Case PII predicate for search filters: the flag stored at ingest, derived
+# from the case's categories on graphs loaded before it existed (no backfill)
+CASE_HAS_PII_CYPHER = (
+    "COALESCE(c.has_pii, size([(c)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory) "
+    "WHERE NOT toUpper(trim(pdc.name)) IN $pii_na_values | 1]) > 0)"
+)
 
 # Country-specific rule priority (higher = takes precedence)
 COUNTRY_RULE_PRIORITY = 100
 
+# Skip the RulesGraph query for same-country transfers when no graph rule can
+# match one (see _domestic_rules_possible); config country prohibitions are
+# still applied. Off by default: any-origin/any-destination rules and rules
+# whose origin and receiving groups overlap do apply to domestic transfers
+ENABLE_SAME_COUNTRY_FAST_PATH = False
+
+# AND order of the UI search filters: the WHERE short-circuits left to right,
+# so the cheapest, most selective checks go first: the PII flag is a stored
+# case property, then the finest process level has the most distinct values
+SEARCH_FILTER_ORDER = (
+    'pii', 'process_l3', 'process_l2', 'process_l1',
+    'origin', 'receiving', 'purposes'
+)
+
+# Serialize JSON responses with orjson (set False to fall back to the stdlib encoder)
+USE_ORJSON = True
+
+# Number of matching precedent cases returned in the evaluation response
+PRECEDENT_SAMPLE_SIZE = 5
+
 # Query timeout in milliseconds (optimized for large graphs)
 QUERY_TIMEOUT_MS = 60000  # 60 seconds for very large graphs
 
 # Cache TTL in seconds
 CACHE_TTL = 300  # 5 minutes
 
+# RulesGraph structural counts only change when the graph is rebuilt
+RULES_GRAPH_STATS_TTL = int(os.environ.get("RULES_GRAPH_STATS_TTL", 3600))
+
+# Maximum cached entries before least-recently-used ones are evicted
+CACHE_MAX_ENTRIES = 2048
+
+# Graph connections shared by all requests; one per query worker thread so
+# concurrent queries never queue behind a single socket
+GRAPH_POOL_SIZE = int(os.environ.get("GRAPH_POOL_SIZE", min((os.cpu_count() or 1) * 4, 32)))
+
+# Seconds a query waits for a free pooled connection before failing
+GRAPH_POOL_TIMEOUT = float(os.environ.get("GRAPH_POOL_TIMEOUT", QUERY_TIMEOUT_MS / 1000))
+
+# A pooled connection idle for longer than this many seconds is PINGed before
+# reuse, so sockets dropped while idle are replaced instead of failing a query
+GRAPH_HEALTH_CHECK_INTERVAL = int(os.environ.get("GRAPH_HEALTH_CHECK_INTERVAL", 30))
+
+# Worker threads for blocking graph queries issued from async endpoints
+QUERY_WORKERS = GRAPH_POOL_SIZE
+
+# (label, property) indexes behind the API's hot match predicates, ensured at
+# startup; optimize_graph_indexes.py creates the full set
+DATA_GRAPH_INDEXES = (
+    ("Case", "case_status"),
+    ("Case", "has_pii"),
+    ("Country", "name"),
+    ("Jurisdiction", "name"),
+    ("Purpose", "name"),
+    ("ProcessL1", "name"),
+    ("ProcessL2", "name"),
+    ("ProcessL3", "name"),
+    ("PersonalDataCategory", "name"),
+)
+RULES_GRAPH_INDEXES = (
+    ("Country", "name"),
+)
+
+# Health data keywords/patterns used when health_data_config.json is missing
+FALLBACK_HEALTH_KEYWORDS = (
+    'health', 'medical', 'patient', 'diagnosis', 'treatment', 'prescription',
+    'clinical', 'hospital', 'doctor', 'disease', 'illness', 'medication',
+    'healthcare', 'wellness', 'fitness', 'biometric', 'genetic', 'vaccine',
+    'surgery', 'therapy', 'pharmaceutical', 'radiology', 'lab', 'laboratory'
+)
+FALLBACK_HEALTH_PATTERNS = (r'icd-?\d+', r'cpt-?\d+', r'diagnosis code', r'medical record')
+
 # ============================================================================
 # Query Optimization for Large Graphs (35k+ nodes, 10M+ edges)
 # ============================================================================
 
-# Simple in-memory cache
-_query_cache = {}
-_cache_timestamps = {}
+# Bounded TTL + LRU cache: key -> (stored_at, value), most recently used last.
+# Shared by the query thread pool, so every access holds the lock.
+_query_cache = OrderedDict()
+_cache_lock = threading.RLock()
+
+# Lookup counters since startup (reported by /api/cache/stats)
+_cache_counters = {'hits': 0, 'misses': 0}
 
 
 def get_cached_result(cache_key: str):
     """Get cached result if not expired"""
-    if cache_key in _query_cache:
-        if time.time() - _cache_timestamps.get(cache_key, 0) < CACHE_TTL:
-            return _query_cache[cache_key]
-    return None
+    with _cache_lock:
+        entry = _query_cache.get(cache_key)
+        if entry is None:
+            _cache_counters['misses'] += 1
+            return None
+        if time.time() - entry[0] >= CACHE_TTL:
+            del _query_cache[cache_key]
+            _cache_counters['misses'] += 1
+            return None
+        _query_cache.move_to_end(cache_key)
+        _cache_counters['hits'] += 1
+        return entry[1]
 
 
 def set_cached_result(cache_key: str, result):
-    """Store result in cache"""
-    _query_cache[cache_key] = result
-    _cache_timestamps[cache_key] = time.time()
+    """Store result in cache, evicting the least recently used entry when full"""
+    with _cache_lock:
+        _query_cache[cache_key] = (time.time(), result)
+        _query_cache.move_to_end(cache_key)
+        while len(_query_cache) > CACHE_MAX_ENTRIES:
+            _query_cache.popitem(last=False)
+
+
+def drop_cached_result(cache_key: str):
+    """Evict one entry, if present"""
+    with _cache_lock:
+        _query_cache.pop(cache_key, None)
+
+
+def clear_cached_results():
+    """Drop every cached entry"""
+    with _cache_lock:
+        _query_cache.clear()
 
 
-def query_with_timeout(graph, query_str, params=None, timeout_ms=QUERY_TIMEOUT_MS, context="", use_cache=False, cache_key=None):
+def cache_stats() -> Dict:
+    """Size, limits and hit/miss counters of the query cache"""
+    with _cache_lock:
+        hits = _cache_counters['hits']
+        misses = _cache_counters['misses']
+        entries = len(_query_cache)
+    lookups = hits + misses
+    return {
+        'entries': entries,
+        'max_entries': CACHE_MAX_ENTRIES,
+        'ttl_seconds': CACHE_TTL,
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / lookups, 4) if lookups else None
+    }
+
+
+def _query_cache_key(graph, query_str: str, params: Optional[Dict]) -> str:
+    """Stable cache key for a query: graph name, query text and sorted params"""
+    raw = f"{getattr(graph, 'name', '')}\x00{query_str}\x00{sorted((params or {}).items())!r}"
+    return "query:" + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def query_with_timeout(graph, query_str, params=None, timeout_ms=QUERY_TIMEOUT_MS, context="", use_cache=False):
     """
     Execute query with timeout to prevent hanging on large graphs.
-    Optionally uses caching for frequently-run queries.
+    Optionally uses caching for frequently-run queries (keyed on query + params).
     """
+    cache_key = _query_cache_key(graph, query_str, params) if use_cache else None
+
     # Check cache first
-    if use_cache and cache_key:
+    if cache_key:
         cached = get_cached_result(cache_key)
         if cached is not None:
-            logger.debug(f"Cache hit: {context}")
+            logger.debug("Cache hit: %s", context)
             return cached
 
     try:
-        if context:
-            logger.debug(f"Query: {context} (timeout: {timeout_ms}ms)")
-
-        result = graph.query(query_str, params=params or {}, timeout=timeout_ms)
+        if context and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query: %s (timeout: %sms)", context, timeout_ms)
+
+        try:
+            result = graph.query(query_str, params=params or {}, timeout=timeout_ms)
+        except redis.exceptions.ConnectionError as e:
+            # A socket dropped mid-query is discarded by the pool, so retry once
+            # on a fresh one; an exhausted pool has already waited its timeout
+            if 'no connection available' in str(e).lower():
+                raise
+            logger.warning(f"Graph connection lost ({context}), retrying once: {e}")
+            result = graph.query(query_str, params=params or {}, timeout=timeout_ms)
 
         # Cache if requested
-        if use_cache and cache_key:
+        if cache_key:
             set_cached_result(cache_key, result)
 
         return result
@@ -107,6 +268,43 @@ def query_with_timeout(graph, query_str, params=None, timeout_ms=QUERY_TIMEOUT_M
             raise HTTPException(status_code=500, detail=f"Database query error: {str(e)}")
 
 
+def query_many(graph, specs, context="") -> List:
+    """
+    Run several (query, params) pairs back to back on the calling thread and
+    return their results in order. The pool is LIFO, so each query checks
+    out the connection the previous one just released: one warm socket per
+    batch instead of one pool round per query. FalkorDB runs every query
+    atomically on its own, so there is no read transaction to share.
+    """
+    return [query_with_timeout(graph, query_str, params=params, context=context)
+            for query_str, params in specs]
+
+
+# Bounded pool so concurrent endpoints can't open unlimited graph connections
+_query_executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix="graph-query")
+
+
+async def query_async(graph, query_str, params=None, context="", use_cache=False):
+    """
+    query_with_timeout on the query thread pool, so the event loop is not
+    blocked and independent queries can be awaited together with asyncio.gather.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _query_executor,
+        partial(query_with_timeout, graph, query_str, params=params, context=context, use_cache=use_cache)
+    )
+
+
+async def run_in_query_pool(func, *args, **kwargs):
+    """
+    Run a blocking, graph-backed function on the query thread pool, so async
+    endpoints never block the event loop while it queries and post-processes
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_query_executor, partial(func, *args, **kwargs))
+
+
 # ============================================================================
 # Load health data configuration
 # ============================================================================
@@ -115,28 +313,84 @@ HEALTH_CONFIG = {}
 if HEALTH_CONFIG_PATH.exists():
     with open(HEALTH_CONFIG_PATH, 'r', encoding='utf-8') as f:
         HEALTH_CONFIG = json.load(f)
-        logger.info(f"Loaded health data config: {len(HEALTH_CONFIG['detection_rules']['keywords'])} keywords, "
-                   f"{len(HEALTH_CONFIG['detection_rules']['patterns'])} patterns")
+        logger.info("Loaded health data config: %d keywords, %d patterns",
+                    len(HEALTH_CONFIG['detection_rules']['keywords']),
+                    len(HEALTH_CONFIG['detection_rules']['patterns']))
 else:
     logger.warning("health_data_config.json not found - using fallback keywords")
 
+# Shared by metadata detection and case classification
+if HEALTH_CONFIG and 'detection_rules' in HEALTH_CONFIG:
+    HEALTH_KEYWORDS = tuple(HEALTH_CONFIG['detection_rules']['keywords'])
+    HEALTH_PATTERNS = tuple(HEALTH_CONFIG['detection_rules'].get('patterns', []))
+else:
+    HEALTH_KEYWORDS = FALLBACK_HEALTH_KEYWORDS
+    HEALTH_PATTERNS = FALLBACK_HEALTH_PATTERNS
+
+# Keywords normalised once at load (lower-cased, de-duplicated, config order);
+# every scanner below matches against lower-cased text
+HEALTH_KEYWORDS_LOWER = tuple(dict.fromkeys(k.lower() for k in HEALTH_KEYWORDS))
+
+# Single-pass scanners: one alternation over every keyword / pattern, so text
+# with no health terms is rejected in one search instead of one per term
+HEALTH_KEYWORDS_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, HEALTH_KEYWORDS_LOWER)) + r')\b')
+HEALTH_PATTERNS_RE = (
+    re.compile('|'.join(f'(?:{p})' for p in HEALTH_PATTERNS), re.IGNORECASE) if HEALTH_PATTERNS else None
+)
+
+# Reporting scanners: one \b-anchored regex per keyword, in config order, so
+# every keyword present is reported even where several start at the same
+# position; they only run on text the combined HEALTH_KEYWORDS_RE flags
+HEALTH_KEYWORD_BY_LOWER = {k.lower(): k for k in reversed(HEALTH_KEYWORDS)}
+HEALTH_KEYWORD_RES = tuple(
+    (keyword, re.compile(r'\b' + re.escape(keyword.lower()) + r'\b')) for keyword in HEALTH_KEYWORDS
+)
+
+# With pyahocorasick installed, one automaton pass finds every keyword in
+# O(len(text) + matches) however many keywords are configured; otherwise the
+# per-keyword scanners above are used
+if ahocorasick is not None and HEALTH_KEYWORD_BY_LOWER:
+    HEALTH_KEYWORDS_AUTOMATON = ahocorasick.Automaton()
+    for _lower, _keyword in HEALTH_KEYWORD_BY_LOWER.items():
+        HEALTH_KEYWORDS_AUTOMATON.add_word(_lower, (len(_lower), _keyword))
+    HEALTH_KEYWORDS_AUTOMATON.make_automaton()
+    del _lower, _keyword
+else:
+    HEALTH_KEYWORDS_AUTOMATON = None
+
 # Load prohibition rules configuration
 PROHIBITION_CONFIG_PATH = Path(__file__).parent / "prohibition_rules_config.json"
 PROHIBITION_CONFIG = {}
 if PROHIBITION_CONFIG_PATH.exists():
     with open(PROHIBITION_CONFIG_PATH, 'r', encoding='utf-8') as f:
         PROHIBITION_CONFIG = json.load(f)
-        logger.info(f"Loaded prohibition rules config: {len(PROHIBITION_CONFIG.get('prohibition_rules', {}))} rules")
+        logger.info("Loaded prohibition rules config: %d rules", len(PROHIBITION_CONFIG.get('prohibition_rules', {})))
 else:
     logger.warning("prohibition_rules_config.json not found")
 
+# Enabled country prohibitions, highest priority first (config order within a
+# priority), with lower-cased country lists: the per-request check can stop
+# at the first match and never re-lowercases the config
+COUNTRY_PROHIBITIONS = sorted(
+    (
+        (COUNTRY_RULE_PRIORITY + rule_config.get('priority', 0), rule_name, rule_config,
+         tuple(c.lower() for c in rule_config.get('origin_countries', [])),
+         None if 'ANY' in rule_config.get('receiving_countries', [])
+         else tuple(c.lower() for c in rule_config.get('receiving_countries', [])))
+        for rule_name, rule_config in PROHIBITION_CONFIG.get('prohibition_rules', {}).items()
+        if rule_config.get('enabled', True)
+    ),
+    key=lambda entry: -entry[0]
+)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Data Transfer Compliance API - Deontic Logic (Optimized)",
     description="Graph-based compliance engine using deontic logic framework (Actions, Permissions, Prohibitions, Duties). Optimized for 35K+ nodes and 10M+ edges.",
     version="4.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse if USE_ORJSON else JSONResponse
 )
 
 # CORS
@@ -148,8 +402,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# FalkorDB connections
-db = FalkorDB(host='localhost', port=6379)
+# Compress larger responses (case lists, rules overview, HTML pages)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# FalkorDB connections: a bounded, blocking pool (a caller waits for a free
+# connection instead of opening unlimited sockets); the client checks one
+# out per query, so both graph handles share it
+_graph_pool = redis.BlockingConnectionPool(
+    host='localhost', port=6379,
+    max_connections=GRAPH_POOL_SIZE,
+    timeout=GRAPH_POOL_TIMEOUT,
+    health_check_interval=GRAPH_HEALTH_CHECK_INTERVAL,
+    socket_keepalive=True,
+    decode_responses=True
+)
+db = FalkorDB(connection_pool=_graph_pool)
 rules_graph = db.select_graph('RulesGraph')
 data_graph = db.select_graph('DataTransferGraph')
 
@@ -160,6 +427,8 @@ data_graph = db.select_graph('DataTransferGraph')
 
 class Duty(BaseModel):
     """A duty/obligation that must be fulfilled"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     module: Optional[str] = None
@@ -168,29 +437,40 @@ class Duty(BaseModel):
 
 class Permission(BaseModel):
     """A permission allowing an action with associated duties"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
-    duties: List[Duty] = Field(default_factory=list)
+    duties: Tuple[Duty, ...] = ()
 
 
 class Prohibition(BaseModel):
     """A prohibition blocking an action, possibly with duties to get exception"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
-    duties: List[Duty] = Field(default_factory=list)
+    duties: Tuple[Duty, ...] = ()
 
 
 class Action(BaseModel):
     """The action being evaluated"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
 
 
 class TriggeredRule(BaseModel):
     """A compliance rule that was triggered"""
+    model_config = ConfigDict(frozen=True)
+
     rule_id: str
     description: str
     priority: int
+    odrl_type: Optional[str] = None
+    odrl_action: Optional[str] = None
+    odrl_target: Optional[str] = None
     action: Optional[Action] = None
     permission: Optional[Permission] = None
     prohibition: Optional[Prohibition] = None
@@ -200,19 +480,24 @@ class TriggeredRule(BaseModel):
     receiving_group: str = ""
 
 
+def _none_to_empty_list(value):
+    """Explicit null from the HTTP layer means no values; handlers iterate without a None check"""
+    return [] if value is None else value
+
+
+def _strip_or_none(value):
+    """Trim request strings once at parse time; blank input becomes None"""
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
 class RulesEvaluationRequest(BaseModel):
     """Request to evaluate compliance rules - all fields are optional for dynamic evaluation"""
-    origin_country: Optional[str] = Field(None, description="Originating country name")
-    receiving_country: Optional[str] = Field(None, description="Receiving country name")
-    pii: Optional[bool] = Field(None, description="Whether transfer contains PII")
-    purpose_of_processing: Optional[List[str]] = Field(None, description="Purpose(s) of data processing")
-    process_l1: Optional[str] = Field(None, description="Process area Level 1")
-    process_l2: Optional[str] = Field(None, description="Process function Level 2")
-    process_l3: Optional[str] = Field(None, description="Process detail Level 3")
-    other_metadata: Optional[Dict[str, str]] = Field(None, description="Additional metadata for health data detection")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "origin_country": "United States",
                 "receiving_country": "China",
@@ -224,37 +509,113 @@ class RulesEvaluationRequest(BaseModel):
                 "other_metadata": {"patient_records": "medical history"}
             }
         }
+    )
+
+    origin_country: Optional[str] = Field(None, description="Originating country name")
+    receiving_country: Optional[str] = Field(None, description="Receiving country name")
+    pii: Optional[bool] = Field(None, description="Whether transfer contains PII")
+    purpose_of_processing: List[str] = Field(default_factory=list, description="Purpose(s) of data processing")
+    process_l1: Optional[str] = Field(None, description="Process area Level 1")
+    process_l2: Optional[str] = Field(None, description="Process function Level 2")
+    process_l3: Optional[str] = Field(None, description="Process detail Level 3")
+    other_metadata: Optional[Dict[str, str]] = Field(None, description="Additional metadata for health data detection")
+
+    _health_cache_key: str = PrivateAttr(default="")
+
+    @field_validator('origin_country', 'receiving_country', 'process_l1', 'process_l2', 'process_l3', mode='before')
+    @classmethod
+    def strip_text(cls, value):
+        return _strip_or_none(value)
+
+    @field_validator('purpose_of_processing', mode='before')
+    @classmethod
+    def purposes_or_empty(cls, value):
+        return _none_to_empty_list(value)
+
+    @model_validator(mode='after')
+    def compute_health_cache_key(self):
+        # Health detection depends only on the metadata; sorted items make the
+        # key order-independent. Triggered rules are memoised separately, per
+        # RulesGraph version (_query_triggered_rules)
+        self._health_cache_key = "health:" + repr(tuple(sorted((self.other_metadata or {}).items())))
+        return self
+
+    @property
+    def health_cache_key(self) -> str:
+        """Canonical signature of the metadata that determines health detection"""
+        return self._health_cache_key
 
 
 class RulesEvaluationResponse(BaseModel):
-    """Response from rules evaluation"""
+    """Response from rules evaluation (triggered_rules/consolidated_duties omitted when verbose=false)"""
     success: bool = True
     transfer_status: str  # ALLOWED or PROHIBITED
     transfer_blocked: bool = False
     blocked_reason: Optional[str] = None
-    triggered_rules: List[TriggeredRule]
+    triggered_rules: Optional[List[TriggeredRule]] = None
     total_rules_triggered: int
     has_prohibitions: bool = False
     has_country_prohibition: bool = False
-    consolidated_duties: List[Duty] = Field(default_factory=list)
+    consolidated_duties: Optional[List[Duty]] = None
     precedent_validation: Optional[Dict] = None
     assessment_compliance: Optional[Dict] = None
 
 
 class SearchCasesRequest(BaseModel):
     """Request to search for cases"""
-    origin_country: Optional[str] = Field(None, description="Originating country (partial match)")
-    receiving_country: Optional[str] = Field(None, description="Receiving country (partial match)")
+    model_config = ConfigDict(frozen=True)
+
+    origin_country: Optional[str] = Field(None, description="Originating country (prefix match, use * for substring)")
+    receiving_country: Optional[str] = Field(None, description="Receiving country (prefix match, use * for substring)")
     pii: Optional[bool] = Field(None, description="Whether transfer contains PII")
-    purpose_of_processing: Optional[List[str]] = Field(None, description="Purpose(s) of data processing")
+    purpose_of_processing: List[str] = Field(default_factory=list, description="Purpose(s) of data processing")
     process_l1: Optional[str] = Field(None, description="Process area Level 1")
     process_l2: Optional[str] = Field(None, description="Process function Level 2")
     process_l3: Optional[str] = Field(None, description="Process detail Level 3")
     other_metadata: Optional[Dict[str, str]] = Field(None, description="Additional metadata filters")
 
+    @field_validator('origin_country', 'receiving_country', 'process_l1', 'process_l2', 'process_l3', mode='before')
+    @classmethod
+    def strip_text(cls, value):
+        return _strip_or_none(value)
+
+    @field_validator('purpose_of_processing', mode='before')
+    @classmethod
+    def purposes_or_empty(cls, value):
+        return _none_to_empty_list(value)
+
 
 class CaseData(BaseModel):
     """A single data transfer case"""
+    model_config = ConfigDict(frozen=True)
+
+    case_id: str
+    eim_id: Optional[str]
+    business_app_id: Optional[str]
+    origin_country: str
+    receiving_countries: List[str]
+    purposes: List[str]
+    process_l1: Optional[str]
+    process_l2: Optional[str]
+    process_l3: Optional[str]
+    pia_module: Optional[str]
+    tia_module: Optional[str]
+    hrpr_module: Optional[str]
+    personal_data: List[str]
+    personal_data_categories: List[str]
+    categories: List[str]
+    has_pii: bool
+    has_health_data: bool = False
+    case_status: Optional[str] = None
+
+
+@dataclass(slots=True)
+class CaseRow:
+    """
+    Lightweight UI search row with the same fields as CaseData.
+    Built once per result row (up to 1000 per search), so it avoids a
+    per-row dict; FastAPI converts it with dataclasses.asdict on the way out.
+    """
     case_id: str
     eim_id: Optional[str]
     business_app_id: Optional[str]
@@ -275,6 +636,39 @@ class CaseData(BaseModel):
     case_status: Optional[str] = None
 
 
+# Compiled once at import; serialises search rows without a per-request
+# response-model validation pass
+_CASE_ROWS_ADAPTER = TypeAdapter(List[CaseRow])
+
+
+@dataclass(slots=True)
+class PrecedentRow:
+    """
+    One STRICT precedent search row. Fields follow the query's RETURN order,
+    so a row is built positionally with no per-row dict.
+    """
+    case_id: str
+    eim_id: Optional[str]
+    business_app_id: Optional[str]
+    app_id: Optional[str]
+    origin_country: str
+    receiving_countries: List[str]
+    purposes: List[str]
+    process_l1: Optional[str]
+    process_l2: Optional[str]
+    process_l3: Optional[str]
+    pia_status: str
+    tia_status: str
+    hrpr_status: str
+    personal_data: List[str]
+    personal_data_categories: List[str]
+    categories: List[str]
+    case_status: str
+    has_pii: bool
+    has_health_data: bool
+    is_compliant: bool
+
+
 class SearchCasesResponse(BaseModel):
     """Response from case search"""
     success: bool = True
@@ -338,6 +732,16 @@ class RulesOverviewResponse(BaseModel):
 # CORE LOGIC FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def _compiled(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regex once per (pattern, flags) for the life of the process.
+    Config-driven patterns are reused on every request, and the stdlib's own
+    cache is small and shared with every other caller of re.
+    """
+    return re.compile(pattern, flags)
+
+
 def detect_health_data_from_metadata(other_metadata: Optional[Dict[str, str]], verbose: bool = True) -> Dict[str, any]:
     """
     Automatically detect if metadata contains health-related information
@@ -346,23 +750,9 @@ def detect_health_data_from_metadata(other_metadata: Optional[Dict[str, str]], v
     if not other_metadata:
         return {'detected': False, 'matched_keywords': [], 'matched_patterns': [], 'matched_fields': []}
 
-    import re
-
-    # Load keywords from config, fallback to basic list
-    if HEALTH_CONFIG and 'detection_rules' in HEALTH_CONFIG:
-        health_keywords = HEALTH_CONFIG['detection_rules']['keywords']
-        health_patterns = HEALTH_CONFIG['detection_rules'].get('patterns', [])
-    else:
-        health_keywords = [
-            'health', 'medical', 'patient', 'diagnosis', 'treatment', 'prescription',
-            'clinical', 'hospital', 'doctor', 'disease', 'illness', 'medication',
-            'healthcare', 'wellness', 'fitness', 'biometric', 'genetic', 'vaccine',
-            'surgery', 'therapy', 'pharmaceutical', 'radiology', 'lab', 'laboratory'
-        ]
-        health_patterns = [r'icd-?\d+', r'cpt-?\d+', r'diagnosis code', r'medical record']
-
-    matched_keywords = []
-    matched_patterns = []
+    # Insertion-ordered sets: constant-time de-duplication, first-seen order kept
+    matched_keywords = {}
+    matched_patterns = {}
     matched_fields = []
 
     for key, value in other_metadata.items():
@@ -370,17 +760,18 @@ def detect_health_data_from_metadata(other_metadata: Optional[Dict[str, str]], v
         normalized_text = field_text.replace('_', ' ').replace('-', ' ')
         field_matched = False
 
-        for keyword in health_keywords:
-            if re.search(r'\b' + re.escape(keyword.lower()) + r'\b', normalized_text):
-                if keyword not in matched_keywords:
-                    matched_keywords.append(keyword)
-                field_matched = True
+        # One scan reports every keyword in the field
+        for keyword in _iter_health_keywords(normalized_text):
+            matched_keywords[keyword] = None
+            field_matched = True
 
-        for pattern in health_patterns:
-            if re.search(pattern, field_text, re.IGNORECASE):
-                if pattern not in matched_patterns:
-                    matched_patterns.append(pattern)
-                field_matched = True
+        # Per-pattern checks (to report which patterns matched) only run for
+        # the fields the combined pattern scanner flags
+        if HEALTH_PATTERNS_RE is not None and HEALTH_PATTERNS_RE.search(field_text):
+            for pattern in HEALTH_PATTERNS:
+                if _compiled(pattern, re.IGNORECASE).search(field_text):
+                    matched_patterns[pattern] = None
+                    field_matched = True
 
         if field_matched:
             matched_fields.append({'key': key, 'value': value})
@@ -388,49 +779,98 @@ def detect_health_data_from_metadata(other_metadata: Optional[Dict[str, str]], v
     detected = len(matched_keywords) > 0 or len(matched_patterns) > 0
 
     if verbose and detected:
-        logger.info(f"Health data detected: {len(matched_keywords)} keywords in {len(matched_fields)} fields")
+        logger.info("Health data detected: %d keywords in %d fields", len(matched_keywords), len(matched_fields))
 
     return {
         'detected': detected,
-        'matched_keywords': matched_keywords,
-        'matched_patterns': matched_patterns,
+        'matched_keywords': list(matched_keywords),
+        'matched_patterns': list(matched_patterns),
         'matched_fields': matched_fields
     }
 
 
-def has_pii_data(personal_data_categories: List[str]) -> bool:
-    """Check if a case contains PII based on personalDataCategory field."""
-    if not personal_data_categories:
-        return False
+def _intern(value):
+    """Intern strings that repeat across result rows (countries, rule ids)"""
+    return sys.intern(value) if isinstance(value, str) else value
 
-    non_na_values = [
-        pdc.strip()
-        for pdc in personal_data_categories
-        if pdc and pdc.strip().upper() not in ['N/A', 'NA', 'NULL', '']
-    ]
 
-    return len(non_na_values) > 0
+def _intern_values(values) -> List[str]:
+    """Non-empty entries of a collected vocabulary list, interned"""
+    return [sys.intern(v) if isinstance(v, str) else v for v in (values or ()) if v]
 
 
-def contains_health_data(personal_data: List[str], personal_data_categories: List[str]) -> bool:
-    """Check if personal data or categories contain health-related information"""
-    import re
+def _first_column(result) -> List:
+    """First column of every result row (reads result_set once)"""
+    return [row[0] for row in result.result_set or ()]
+
+
+def _drain_rows(result) -> Iterator[List]:
+    """
+    Yield a result's rows in order, releasing each raw row as it is consumed.
+    FalkorDB returns the whole result set at once (there is no server-side
+    cursor), so this keeps raw rows plus the objects built from them near one
+    copy instead of two. The result is emptied: never use on a cached result.
+    """
+    rows = result.result_set or []
+    result.result_set = []
+    rows.reverse()
+    while rows:
+        yield rows.pop()
 
-    health_keywords = [
-        'health', 'medical', 'patient', 'diagnosis', 'treatment', 'prescription',
-        'clinical', 'hospital', 'doctor', 'disease', 'illness', 'medication',
-        'healthcare', 'wellness', 'fitness', 'biometric', 'genetic'
-    ]
 
-    all_data = personal_data + personal_data_categories
-    all_data_lower = [item.lower() for item in all_data if item]
+def _merge_unique(a: List[str], b: List[str]) -> List[str]:
+    """Merge two already-sorted lists into one sorted list without duplicates"""
+    merged = []
+    append = merged.append
+    prev = None
+    for name in heapq.merge(a, b):
+        if name != prev:
+            append(name)
+            prev = name
+    return merged
 
-    for data_item in all_data_lower:
-        for keyword in health_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', data_item):
-                return True
 
-    return False
+@lru_cache(maxsize=256)
+def _norm(value: str) -> str:
+    """Lower-case user search input once; repeated UI polls reuse the same string"""
+    return value.lower()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+def _iter_health_keywords(text: str) -> Iterator[str]:
+    """Configured health keywords occurring as whole words in lower-cased text"""
+    if HEALTH_KEYWORDS_AUTOMATON is None:
+        if HEALTH_KEYWORDS_RE.search(text) is not None:
+            for keyword, keyword_re in HEALTH_KEYWORD_RES:
+                if keyword_re.search(text):
+                    yield keyword
+        return
+
+    last = len(text) - 1
+    for end, (length, keyword) in HEALTH_KEYWORDS_AUTOMATON.iter(text):
+        start = end - length + 1
+        # Same word-boundary rule as the \b-anchored regexes
+        if (start == 0 or not _is_word_char(text[start - 1])) and (end == last or not _is_word_char(text[end + 1])):
+            yield keyword
+
+
+def has_pii_data(personal_data_categories: List[str]) -> bool:
+    """Check if a case contains PII based on personalDataCategory field."""
+    # Stops at the first real category; empty or missing input is simply no PII
+    return any(pdc and pdc.strip().upper() not in PII_NA_VALUES for pdc in (personal_data_categories or ()))
+
+
+def contains_health_data(personal_data: List[str], personal_data_categories: List[str]) -> bool:
+    """Check if personal data or categories contain health-related information"""
+    # One scan of a space-joined string; the separator keeps word boundaries per
+    # item, and the two lists are chained rather than concatenated into a third
+    joined = ' '.join(filter(None, chain(personal_data, personal_data_categories))).lower()
+    if HEALTH_KEYWORDS_AUTOMATON is None:
+        return HEALTH_KEYWORDS_RE.search(joined) is not None
+    return next(_iter_health_keywords(joined), None) is not None
 
 
 def check_country_specific_prohibition(origin: str, receiving: str, has_pii: bool = None, has_health_data: bool = None) -> Optional[Dict]:
@@ -438,36 +878,24 @@ def check_country_specific_prohibition(origin: str, receiving: str, has_pii: boo
     Check if there's a country-specific prohibition rule that takes precedence.
     Country-specific rules OVERRIDE PIA/TIA/HRPR assessments.
 
+    Rules are checked highest priority first, so the returned prohibition
+    is the one that takes precedence when several match.
+
     Returns:
         Dict with prohibition details if found, None otherwise
     """
-    if not PROHIBITION_CONFIG or 'prohibition_rules' not in PROHIBITION_CONFIG:
-        return None
+    origin_lc = origin.lower()
+    receiving_lc = receiving.lower()
 
-    for rule_name, rule_config in PROHIBITION_CONFIG['prohibition_rules'].items():
-        if not rule_config.get('enabled', True):
+    for priority, rule_name, rule_config, origins_lc, receivings_lc in COUNTRY_PROHIBITIONS:
+        # Check origin match (exact or contained in the configured name)
+        if not any(origin_lc in c for c in origins_lc):
             continue
 
-        # Check origin match
-        origin_countries = rule_config.get('origin_countries', [])
-        origin_match = any(
-            origin.lower() == c.lower() or origin.lower() in c.lower()
-            for c in origin_countries
-        )
-
-        if not origin_match:
+        # Check receiving match (None means the rule applies to ANY receiver)
+        if receivings_lc is not None and not any(receiving_lc in c for c in receivings_lc):
             continue
 
-        # Check receiving match
-        receiving_countries = rule_config.get('receiving_countries', [])
-        if 'ANY' not in receiving_countries:
-            receiving_match = any(
-                receiving.lower() == c.lower() or receiving.lower() in c.lower()
-                for c in receiving_countries
-            )
-            if not receiving_match:
-                continue
-
         # Check PII requirement
         if rule_config.get('requires_pii') and not has_pii:
             continue
@@ -483,63 +911,54 @@ def check_country_specific_prohibition(origin: str, receiving: str, has_pii: boo
             'prohibition_name': rule_config.get('prohibition_name', rule_name),
             'prohibition_description': rule_config.get('prohibition_description', ''),
             'duties': rule_config.get('duties', []),
-            'origin_countries': origin_countries,
-            'receiving_countries': receiving_countries,
-            'priority': COUNTRY_RULE_PRIORITY + rule_config.get('priority', 0),
+            'origin_countries': rule_config.get('origin_countries', []),
+            'receiving_countries': rule_config.get('receiving_countries', []),
+            'priority': priority,
             'is_country_specific': True
         }
 
     return None
 
 
-def query_triggered_rules_deontic(origin: str, receiving: str, has_pii: bool = None, has_health_data: bool = None) -> Dict:
-    """
-    Query the RulesGraph using deontic logic structure.
-    Returns rules with their actions, permissions, prohibitions, and duties.
-    """
-    logger.info(f"Querying Deontic RulesGraph for: {origin} -> {receiving}, pii={has_pii}, health={has_health_data}")
+def _duty_key(duty: Dict) -> tuple:
+    """Identity of a duty for consolidation across rules"""
+    return (duty['name'], duty.get('module'), duty.get('value'))
 
-    # First check for country-specific prohibition (takes precedence)
-    country_prohibition = check_country_specific_prohibition(origin, receiving, has_pii, has_health_data)
 
-    query = """
-    // Get origin country's groups
-    MATCH (origin:Country {name: $origin_country})-[:BELONGS_TO]->(origin_group:CountryGroup)
-    WITH collect(DISTINCT origin_group.name) as origin_groups
+def _register_duties(duties: List[Dict], consolidated: Dict[tuple, Dict]):
+    """Add a rule's duty maps to the consolidated map (first occurrence wins)"""
+    for duty in duties:
+        consolidated.setdefault(_duty_key(duty), duty)
 
-    // Get receiving country's groups
-    MATCH (receiving:Country {name: $receiving_country})-[:BELONGS_TO]->(receiving_group:CountryGroup)
-    WITH origin_groups, collect(DISTINCT receiving_group.name) as receiving_groups
 
-    // Match all rules and check their conditions
-    MATCH (r:Rule)
+# One query shape for single and batched evaluation: every input is UNWound
+# with its index, the per-input stages carry that index (and the input's
+# PII/health flags) along, and rows come back grouped by it
+TRIGGERED_RULES_QUERY = """
+    UNWIND $inputs AS inp
+    WITH inp.idx as idx, inp.origin as origin_name, inp.receiving as receiving_name,
+         inp.has_pii as has_pii, inp.has_health_data as has_health_data
+
+    // Both countries must belong to at least one group
+    MATCH (origin:Country {name: origin_name}), (receiving:Country {name: receiving_name})
+    WHERE (origin)-[:BELONGS_TO]->(:CountryGroup) AND (receiving)-[:BELONGS_TO]->(:CountryGroup)
 
-    OPTIONAL MATCH (r)-[:TRIGGERED_BY_ORIGIN]->(r_origin:CountryGroup)
-    WITH r, origin_groups, receiving_groups, collect(DISTINCT r_origin.name) as rule_origin_groups
-
-    OPTIONAL MATCH (r)-[:TRIGGERED_BY_RECEIVING]->(r_receiving:CountryGroup)
-    WITH r, origin_groups, receiving_groups, rule_origin_groups,
-         collect(DISTINCT r_receiving.name) as rule_receiving_groups
-
-    WITH r, origin_groups, receiving_groups, rule_origin_groups, rule_receiving_groups,
-         CASE
-             WHEN r.origin_match_type = 'ALL' THEN true
-             WHEN r.origin_match_type = 'ANY' AND size(rule_origin_groups) = 0 THEN false
-             WHEN r.origin_match_type = 'ANY' THEN any(g IN origin_groups WHERE g IN rule_origin_groups)
-             ELSE false
-         END as origin_matches,
-         CASE
-             WHEN r.receiving_match_type = 'ALL' THEN true
-             WHEN r.receiving_match_type = 'ANY' AND size(rule_receiving_groups) = 0 THEN false
-             WHEN r.receiving_match_type = 'ANY' THEN any(g IN receiving_groups WHERE g IN rule_receiving_groups)
-             WHEN r.receiving_match_type = 'NOT_IN' AND size(rule_receiving_groups) = 0 THEN true
-             WHEN r.receiving_match_type = 'NOT_IN' THEN NOT any(g IN receiving_groups WHERE g IN rule_receiving_groups)
-             ELSE false
-         END as receiving_matches
-
-    WHERE origin_matches AND receiving_matches
-          AND (NOT r.has_pii_required OR $has_pii = true)
-          AND (NOT r.health_data_required OR $has_health_data = true)
+    // Rules are filtered on the MATCH itself, so only matching rules reach the
+    // enrichment below: the PII/health property checks go first, then group
+    // overlap, answered by adjacency - a shared group is a two-hop path between
+    // the country and the rule, so no group name lists are collected and
+    // compared (a rule with no groups has no such path: ANY fails, NOT_IN passes)
+    MATCH (r:Rule)
+    WHERE (NOT r.has_pii_required OR has_pii = true)
+      AND (NOT r.health_data_required OR has_health_data = true)
+      AND (r.origin_match_type = 'ALL'
+           OR (r.origin_match_type = 'ANY'
+               AND size([(origin)-[:BELONGS_TO]->(:CountryGroup)<-[:TRIGGERED_BY_ORIGIN]-(r) | 1]) > 0))
+      AND (r.receiving_match_type = 'ALL'
+           OR (r.receiving_match_type = 'ANY'
+               AND size([(receiving)-[:BELONGS_TO]->(:CountryGroup)<-[:TRIGGERED_BY_RECEIVING]-(r) | 1]) > 0)
+           OR (r.receiving_match_type = 'NOT_IN'
+               AND size([(receiving)-[:BELONGS_TO]->(:CountryGroup)<-[:TRIGGERED_BY_RECEIVING]-(r) | 1]) = 0))
 
     OPTIONAL MATCH (r)-[:HAS_ACTION]->(action:Action)
     OPTIONAL MATCH (r)-[:HAS_PERMISSION]->(perm:Permission)
@@ -547,167 +966,240 @@ def query_triggered_rules_deontic(origin: str, receiving: str, has_pii: bool = N
     OPTIONAL MATCH (r)-[:HAS_PROHIBITION]->(prohib:Prohibition)
     OPTIONAL MATCH (prohib)-[:CAN_HAVE_DUTY]->(prohib_duty:Duty)
 
-    RETURN r.rule_id as rule_id,
+    // Duty maps are collected per rule; null-name entries (no duty) are dropped here
+    WITH idx, r, action, perm, prohib,
+         [d IN collect(DISTINCT {name: perm_duty.name, description: coalesce(perm_duty.description, ''),
+                                 module: perm_duty.module, value: perm_duty.value})
+          WHERE d.name IS NOT NULL] as perm_duties,
+         [d IN collect(DISTINCT {name: prohib_duty.name, description: coalesce(prohib_duty.description, ''),
+                                 module: prohib_duty.module, value: prohib_duty.value})
+          WHERE d.name IS NOT NULL] as prohib_duties,
+         [m IN collect(DISTINCT CASE WHEN perm.name IS NOT NULL AND perm_duty.name IS NOT NULL
+                                     THEN toLower(perm_duty.module) END) |
+             CASE WHEN m CONTAINS 'pia' THEN 'PIA'
+                  WHEN m CONTAINS 'tia' THEN 'TIA'
+                  WHEN m CONTAINS 'hrpr' THEN 'HRPR' END] as required_assessments
+
+    // Each rule comes back as ready-made response objects (null when absent)
+    RETURN idx,
+           r.rule_id as rule_id,
            r.description as description,
            r.priority as priority,
            r.odrl_type as odrl_type,
            r.odrl_action as odrl_action,
            r.odrl_target as odrl_target,
-           action.name as action_name,
-           action.description as action_description,
-           perm.name as permission_name,
-           perm.description as permission_description,
-           collect(DISTINCT {name: perm_duty.name, description: perm_duty.description,
-                            module: perm_duty.module, value: perm_duty.value}) as permission_duties,
-           prohib.name as prohibition_name,
-           prohib.description as prohibition_description,
-           collect(DISTINCT {name: prohib_duty.name, description: prohib_duty.description,
-                            module: prohib_duty.module, value: prohib_duty.value}) as prohibition_duties
-    ORDER BY r.priority
+           CASE WHEN action.name IS NULL THEN null
+                ELSE {name: action.name, description: coalesce(action.description, '')} END as action,
+           CASE WHEN perm.name IS NULL THEN null
+                ELSE {name: perm.name, description: coalesce(perm.description, ''), duties: perm_duties} END as permission,
+           CASE WHEN prohib.name IS NULL THEN null
+                ELSE {name: prohib.name, description: coalesce(prohib.description, ''), duties: prohib_duties} END as prohibition,
+           required_assessments
+    ORDER BY idx, priority DESC, rule_id
+"""
+
+
+def _fetch_triggered_rule_rows(transfers: List[tuple]) -> List[List]:
     """
+    Run TRIGGERED_RULES_QUERY once for a list of
+    (origin, receiving, has_pii, has_health_data) transfers.
+    Returns one list of rule rows (idx column dropped) per transfer, in order.
+    """
+    inputs = [
+        {
+            'idx': idx,
+            'origin': origin,
+            'receiving': receiving,
+            'has_pii': bool(has_pii),
+            'has_health_data': bool(has_health_data)
+        }
+        for idx, (origin, receiving, has_pii, has_health_data) in enumerate(transfers)
+    ]
+    result = query_with_timeout(rules_graph, TRIGGERED_RULES_QUERY, params={'inputs': inputs},
+                                context=f"Query triggered rules ({len(inputs)} transfer(s))")
 
-    try:
-        result = query_with_timeout(
-            rules_graph,
-            query,
-            params={
-                'origin_country': origin,
-                'receiving_country': receiving,
-                'has_pii': has_pii if has_pii is not None else False,
-                'has_health_data': has_health_data if has_health_data is not None else False
+    rows_by_transfer = [[] for _ in inputs]
+    for row in _drain_rows(result):
+        rows_by_transfer[row[0]].append(row[1:])
+    return rows_by_transfer
+
+
+def _build_rules_result(origin: str, receiving: str, has_pii: Optional[bool], has_health_data: Optional[bool],
+                        rows: List) -> Dict:
+    """Merge a transfer's graph rule rows with its country-specific prohibition"""
+    # First check for country-specific prohibition (takes precedence)
+    country_prohibition = check_country_specific_prohibition(origin, receiving, has_pii, has_health_data)
+
+    triggered_rules = []
+    country_rule = None
+    consolidated_duties_map = {}
+    required_assessments = set()
+    has_prohibitions = False
+    has_country_prohibition = country_prohibition is not None
+
+    # Country-specific prohibition rule, merged into the graph rules below
+    if country_prohibition:
+        has_prohibitions = True
+        prohibition_duties = [
+            {'name': d, 'description': f'Required: {d}', 'module': None, 'value': None}
+            for d in country_prohibition['duties']
+        ]
+        for duty in prohibition_duties:
+            consolidated_duties_map.setdefault(_duty_key(duty), duty)
+
+        country_rule = {
+            'rule_id': country_prohibition['rule_id'],
+            'description': country_prohibition['prohibition_description'],
+            'priority': country_prohibition['priority'],
+            'odrl_type': 'Prohibition',
+            'odrl_action': 'transfer',
+            'odrl_target': 'Data',
+            'action': {'name': 'Transfer Data', 'description': 'Cross-border data transfer'},
+            'permission': None,
+            'prohibition': {
+                'name': country_prohibition['prohibition_name'],
+                'description': country_prohibition['prohibition_description'],
+                'duties': prohibition_duties
             },
-            context="Query triggered rules"
-        )
+            'is_blocked': True,
+            'is_country_specific': True,
+            'origin_group': ','.join(country_prohibition['origin_countries']),
+            'receiving_group': ','.join(country_prohibition['receiving_countries'])
+        }
 
-        triggered_rules = []
-        consolidated_duties_map = {}
-        has_prohibitions = False
-        has_country_prohibition = country_prohibition is not None
-
-        # Add country-specific prohibition rule first (highest priority)
-        if country_prohibition:
-            has_prohibitions = True
-            prohibition_duties = [
-                {'name': d, 'description': f'Required: {d}', 'module': None, 'value': None}
-                for d in country_prohibition['duties']
-            ]
-            for duty in prohibition_duties:
-                consolidated_duties_map[duty['name']] = duty
+    # Process graph rules: action/permission/prohibition arrive as maps
+    if rows:
+        for (rule_id, description, priority, odrl_type, odrl_action, odrl_target,
+             action_obj, permission_obj, prohibition_obj, rule_assessments) in rows:
+            # Assessment labels (PIA/TIA/HRPR) of the permission duties,
+            # classified in the query; null means an unrelated module
+            required_assessments.update(filter(None, rule_assessments or ()))
+
+            if permission_obj:
+                _register_duties(permission_obj['duties'], consolidated_duties_map)
+
+            is_blocked = False
+            if prohibition_obj:
+                _register_duties(prohibition_obj['duties'], consolidated_duties_map)
+                is_blocked = True
+                has_prohibitions = True
 
             triggered_rules.append({
-                'rule_id': country_prohibition['rule_id'],
-                'description': country_prohibition['prohibition_description'],
-                'priority': country_prohibition['priority'],
-                'odrl_type': 'Prohibition',
-                'odrl_action': 'transfer',
-                'odrl_target': 'Data',
-                'action': {'name': 'Transfer Data', 'description': 'Cross-border data transfer'},
-                'permission': None,
-                'prohibition': {
-                    'name': country_prohibition['prohibition_name'],
-                    'description': country_prohibition['prohibition_description'],
-                    'duties': prohibition_duties
-                },
-                'is_blocked': True,
-                'is_country_specific': True,
-                'origin_group': ','.join(country_prohibition['origin_countries']),
-                'receiving_group': ','.join(country_prohibition['receiving_countries'])
+                'rule_id': _intern(rule_id),
+                'description': description,
+                'priority': priority,
+                'odrl_type': odrl_type or None,
+                'odrl_action': odrl_action or None,
+                'odrl_target': odrl_target or None,
+                'action': action_obj,
+                'permission': permission_obj,
+                'prohibition': prohibition_obj,
+                'is_blocked': is_blocked,
+                'is_country_specific': False,
+                'origin_group': '',
+                'receiving_group': ''
             })
 
-        # Process graph rules
-        if result.result_set:
-            for row in result.result_set:
-                rule_id = row[0]
-                description = row[1]
-                priority = row[2]
-                odrl_type = row[3] if row[3] else None
-                odrl_action = row[4] if row[4] else None
-                odrl_target = row[5] if row[5] else None
-                action_name = row[6] if row[6] else None
-                action_description = row[7] if row[7] else None
-                permission_name = row[8] if row[8] else None
-                permission_description = row[9] if row[9] else None
-                permission_duties = row[10] if row[10] else []
-                prohibition_name = row[11] if row[11] else None
-                prohibition_description = row[12] if row[12] else None
-                prohibition_duties = row[13] if row[13] else []
-
-                action_obj = None
-                if action_name:
-                    action_obj = {'name': action_name, 'description': action_description or ''}
-
-                permission_obj = None
-                if permission_name:
-                    perm_duties_list = []
-                    for duty in permission_duties:
-                        if duty.get('name'):
-                            duty_obj = {
-                                'name': duty['name'],
-                                'description': duty.get('description', ''),
-                                'module': duty.get('module'),
-                                'value': duty.get('value')
-                            }
-                            perm_duties_list.append(duty_obj)
-                            consolidated_duties_map[duty['name']] = duty_obj
-
-                    permission_obj = {
-                        'name': permission_name,
-                        'description': permission_description or '',
-                        'duties': perm_duties_list
-                    }
+    # Graph rows arrive ordered by priority (highest first) then rule_id,
+    # so only the config-driven country rule needs placing
+    if country_rule:
+        rule_sort_key = lambda r: (-r.get('priority', 0), r.get('rule_id', ''))
+        triggered_rules = list(heapq.merge([country_rule], triggered_rules, key=rule_sort_key))
 
-                prohibition_obj = None
-                is_blocked = False
-                if prohibition_name:
-                    prohib_duties_list = []
-                    for duty in prohibition_duties:
-                        if duty.get('name'):
-                            duty_obj = {
-                                'name': duty['name'],
-                                'description': duty.get('description', ''),
-                                'module': duty.get('module'),
-                                'value': duty.get('value')
-                            }
-                            prohib_duties_list.append(duty_obj)
-                            consolidated_duties_map[duty['name']] = duty_obj
-
-                    prohibition_obj = {
-                        'name': prohibition_name,
-                        'description': prohibition_description or '',
-                        'duties': prohib_duties_list
-                    }
-                    is_blocked = True
-                    has_prohibitions = True
+    total_rules_triggered = len(triggered_rules)
 
-                triggered_rules.append({
-                    'rule_id': rule_id,
-                    'description': description,
-                    'priority': priority,
-                    'odrl_type': odrl_type,
-                    'odrl_action': odrl_action,
-                    'odrl_target': odrl_target,
-                    'action': action_obj,
-                    'permission': permission_obj,
-                    'prohibition': prohibition_obj,
-                    'is_blocked': is_blocked,
-                    'is_country_specific': False,
-                    'origin_group': '',
-                    'receiving_group': ''
-                })
-
-        # Sort by priority (country-specific rules first)
-        triggered_rules.sort(key=lambda r: (-r.get('priority', 0), r.get('rule_id', '')))
-
-        logger.info(f"Triggered {len(triggered_rules)} rules, has_prohibitions={has_prohibitions}, country_prohibition={has_country_prohibition}")
+    logger.info("Triggered %d rules, has_prohibitions=%s, country_prohibition=%s",
+                total_rules_triggered, has_prohibitions, has_country_prohibition)
+
+    return {
+        'triggered_rules': triggered_rules,
+        'total_rules_triggered': total_rules_triggered,
+        'has_prohibitions': has_prohibitions,
+        'has_country_prohibition': has_country_prohibition,
+        'consolidated_duties': list(consolidated_duties_map.values()),
+        'required_assessments': sorted(required_assessments)
+    }
+
+
+@lru_cache(maxsize=4096)
+def _query_triggered_rules(origin: str, receiving: str, has_pii: Optional[bool], has_health_data: Optional[bool],
+                           rules_version: int, ttl_bucket: int) -> Dict:
+    """
+    Query the RulesGraph using deontic logic structure.
+    Returns rules with their actions, permissions, prohibitions, and duties.
+
+    Memoised per (origin, receiving, has_pii, has_health_data): the rule set
+    changes rarely and the input space is small. rules_version is part of the
+    key so bumping _RULES_GRAPH_VERSION invalidates every entry, and
+    ttl_bucket (see _rules_ttl_bucket) expires them after CACHE_TTL even when
+    a rebuild was never reported; failures raise, so they are never cached.
+    The result is shared between callers and must not be mutated.
+    """
+    logger.info("Querying Deontic RulesGraph for: %s -> %s, pii=%s, health=%s", origin, receiving, has_pii, has_health_data)
+
+    rows = _fetch_triggered_rule_rows([(origin, receiving, has_pii, has_health_data)])[0]
+    return _build_rules_result(origin, receiving, has_pii, has_health_data, rows)
+
+
+@lru_cache(maxsize=1)
+def _domestic_rules_possible(rules_version: int, ttl_bucket: int) -> bool:
+    """
+    Whether any RulesGraph rule can trigger for a same-country transfer: one
+    with an ALL or NOT_IN match type, or whose origin and receiving groups
+    share a country. Memoised like _query_triggered_rules; failures raise, so
+    an unknown answer is never cached.
+    """
+    query = """
+    MATCH (r:Rule)
+    WHERE r.origin_match_type IN ['ALL', 'NOT_IN']
+       OR r.receiving_match_type IN ['ALL', 'NOT_IN']
+       OR size([(r)-[:TRIGGERED_BY_ORIGIN]->(:CountryGroup)<-[:BELONGS_TO]-(:Country)
+                 -[:BELONGS_TO]->(:CountryGroup)<-[:TRIGGERED_BY_RECEIVING]-(r) | 1]) > 0
+    RETURN count(r) > 0
+    """
+    result = query_with_timeout(rules_graph, query, context="Domestic rule check")
+    rows = result.result_set
+    return bool(rows and rows[0][0])
+
+
+def _rules_ttl_bucket() -> int:
+    """Current CACHE_TTL-wide time slot; part of the RulesGraph memo keys, so entries expire"""
+    return int(time.time() // CACHE_TTL)
 
-        return {
-            'triggered_rules': triggered_rules,
-            'total_rules_triggered': len(triggered_rules),
-            'has_prohibitions': has_prohibitions,
-            'has_country_prohibition': has_country_prohibition,
-            'consolidated_duties': list(consolidated_duties_map.values())
-        }
 
+# Bumped whenever the RulesGraph is reloaded; part of the triggered-rules memo key
+_RULES_GRAPH_VERSION = 0
+
+
+# (fetched_at, payload) of /api/test-rules-graph; None until first fetched
+_rules_graph_stats: Optional[Tuple[float, Dict]] = None
+
+
+def invalidate_rules_cache():
+    """
+    Forget everything derived from the RulesGraph (call after it changes):
+    memoised triggered rules, the domestic-rule check, graph stats and the
+    cached rules overview
+    """
+    global _RULES_GRAPH_VERSION, _rules_graph_stats
+    _RULES_GRAPH_VERSION += 1
+    _rules_graph_stats = None
+    _query_triggered_rules.cache_clear()
+    _domestic_rules_possible.cache_clear()
+    drop_cached_result("rules_overview")
+
+
+def query_triggered_rules_deontic(origin: str, receiving: str, has_pii: bool = None, has_health_data: bool = None,
+                                  top_k: Optional[int] = None) -> Dict:
+    """
+    Triggered rules for a transfer, from the memoised RulesGraph evaluation.
+
+    If top_k is given, only the top_k highest-priority rules are returned
+    (total_rules_triggered still reports the full count).
+    """
+    try:
+        result = _query_triggered_rules(origin, receiving, has_pii, has_health_data,
+                                        _RULES_GRAPH_VERSION, _rules_ttl_bucket())
     except Exception as e:
         logger.error(f"Error querying RulesGraph: {e}", exc_info=True)
         return {
@@ -715,9 +1207,95 @@ def query_triggered_rules_deontic(origin: str, receiving: str, has_pii: bool = N
             'total_rules_triggered': 0,
             'has_prohibitions': False,
             'has_country_prohibition': False,
-            'consolidated_duties': []
+            'consolidated_duties': [],
+            'required_assessments': [],
+            'error': str(e)
         }
 
+    if top_k is not None:
+        return {**result, 'triggered_rules': result['triggered_rules'][:top_k]}
+    return result
+
+
+def query_triggered_rules_deontic_batch(transfers: List[tuple]) -> List[Dict]:
+    """
+    Triggered rules for many (origin, receiving, has_pii, has_health_data)
+    transfers in one RulesGraph round-trip; results are returned in input order.
+    """
+    if not transfers:
+        return []
+
+    logger.info("Querying Deontic RulesGraph for %d transfers", len(transfers))
+    try:
+        rows_by_transfer = _fetch_triggered_rule_rows(transfers)
+    except Exception as e:
+        logger.error(f"Error querying RulesGraph: {e}", exc_info=True)
+        return [
+            {
+                'triggered_rules': [],
+                'total_rules_triggered': 0,
+                'has_prohibitions': False,
+                'has_country_prohibition': False,
+                'consolidated_duties': [],
+                'required_assessments': [],
+                'error': str(e)
+            }
+            for _ in transfers
+        ]
+
+    return [
+        _build_rules_result(origin, receiving, has_pii, has_health_data, rows)
+        for (origin, receiving, has_pii, has_health_data), rows in zip(transfers, rows_by_transfer)
+    ]
+
+
+# One bit per assessment type, so "all required assessments completed" is a
+# single mask test per case
+ASSESSMENT_BITS = {'PIA': 1, 'TIA': 2, 'HRPR': 4}
+
+
+@lru_cache(maxsize=64)
+def _required_mask(required_assessments: tuple) -> Optional[int]:
+    """Bitmask of the required assessments, or None if one has no bit"""
+    mask = 0
+    for assessment in required_assessments:
+        bit = ASSESSMENT_BITS.get(assessment)
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
+
+
+def _completed_mask(pia_status: str, tia_status: str, hrpr_status: str) -> int:
+    mask = 0
+    if pia_status and pia_status.lower() == 'completed':
+        mask |= ASSESSMENT_BITS['PIA']
+    if tia_status and tia_status.lower() == 'completed':
+        mask |= ASSESSMENT_BITS['TIA']
+    if hrpr_status and hrpr_status.lower() == 'completed':
+        mask |= ASSESSMENT_BITS['HRPR']
+    return mask
+
+
+def is_assessment_compliant(required_assessments: List[str],
+                            pia_status: str = None,
+                            tia_status: str = None,
+                            hrpr_status: str = None,
+                            case_status: str = None) -> bool:
+    """
+    Boolean form of evaluate_assessment_compliance, with no messages built:
+    valid case status and every required assessment Completed
+    """
+    if case_status and case_status not in VALID_CASE_STATUSES_SET:
+        return False
+    if not required_assessments:
+        return True
+    required_mask = _required_mask(tuple(required_assessments))
+    if required_mask is None:
+        # Not a known assessment, so it can never be Completed
+        return False
+    return not required_mask & ~_completed_mask(pia_status, tia_status, hrpr_status)
+
 
 def evaluate_assessment_compliance(required_assessments: List[str],
                                    pia_status: str = None,
@@ -731,13 +1309,13 @@ def evaluate_assessment_compliance(required_assessments: List[str],
     2. Only "Completed" status = compliant for assessments
     """
     # Check case status validity
-    if case_status and case_status not in VALID_CASE_STATUSES:
+    if case_status and case_status not in VALID_CASE_STATUSES_SET:
         return {
             'compliant': False,
             'message': f'NON-COMPLIANT: Case status "{case_status}" is not valid for compliance',
             'required': required_assessments,
             'completed': [],
-            'missing': [f'Case Status (current: {case_status}, valid: {VALID_CASE_STATUSES})']
+            'missing': [f'Case Status (current: {case_status}, valid: {list(VALID_CASE_STATUSES)})']
         }
 
     if not required_assessments:
@@ -749,6 +1327,17 @@ def evaluate_assessment_compliance(required_assessments: List[str],
             'missing': []
         }
 
+    # Compliant cases return before any per-assessment status is formatted
+    if is_assessment_compliant(required_assessments, pia_status, tia_status, hrpr_status):
+        return {
+            'compliant': True,
+            'message': f"COMPLIANT: All {len(required_assessments)} required assessments are Completed",
+            'required': required_assessments,
+            'completed': list(required_assessments),
+            'missing': []
+        }
+
+    # Only the non-compliant result needs the per-assessment breakdown
     status_map = {
         'PIA': pia_status,
         'TIA': tia_status,
@@ -765,22 +1354,59 @@ def evaluate_assessment_compliance(required_assessments: List[str],
         else:
             missing.append(f"{assessment} (status: {status or 'Not Provided'})")
 
-    is_compliant = len(missing) == 0
-
-    if is_compliant:
-        message = f"COMPLIANT: All {len(required_assessments)} required assessments are Completed"
-    else:
-        message = f"NON-COMPLIANT: {len(missing)} assessment(s) not completed: {', '.join(missing)}"
-
     return {
-        'compliant': is_compliant,
-        'message': message,
+        'compliant': False,
+        'message': f"NON-COMPLIANT: {len(missing)} assessment(s) not completed: {', '.join(missing)}",
         'required': required_assessments,
         'completed': completed,
         'missing': missing
     }
 
 
+def _precedent_summary(origin: str, receiving: str, purposes: Optional[List[str]],
+                       process_l1: Optional[str], process_l2: Optional[str], process_l3: Optional[str],
+                       has_pii: Optional[bool], required_assessments: List[str]) -> tuple:
+    """
+    (matching cases, compliant cases, sample cases) of a STRICT precedent search.
+    Summaries are cached for CACHE_TTL (cleared by /api/cache/clear), keyed on
+    the search arguments; purposes and assessments are sets, so their order
+    does not split the cache. A failed search counts as no cases and is not cached.
+    """
+    cache_key = "precedents:" + repr((
+        origin, receiving, tuple(sorted(set(purposes or ()))),
+        process_l1, process_l2, process_l3, has_pii,
+        tuple(sorted(set(required_assessments)))
+    ))
+    summary = get_cached_result(cache_key)
+    if summary is not None:
+        return summary
+
+    try:
+        # Cases are streamed, so only the sample returned to the caller is
+        # kept; the rest contribute just their query-computed is_compliant
+        # column, counted in one pass
+        cases = search_data_graph_strict(
+            origin=origin,
+            receiving=receiving,
+            purposes=purposes,
+            process_l1=process_l1,
+            process_l2=process_l2,
+            process_l3=process_l3,
+            has_pii=has_pii,
+            required_assessments=required_assessments
+        )
+        sample_cases = list(islice(cases, PRECEDENT_SAMPLE_SIZE))
+        compliant_column = [case.is_compliant for case in sample_cases]
+        compliant_column.extend(case.is_compliant for case in cases)
+    except Exception as e:
+        logger.error(f"Error in strict precedent search: {e}", exc_info=True)
+        return 0, 0, []
+
+    summary = (len(compliant_column), compliant_column.count(True), sample_cases)
+    set_cached_result(cache_key, summary)
+    return summary
+
+
 def validate_precedents(origin: str, receiving: str,
                        purposes: List[str] = None,
                        process_l1: str = None,
@@ -810,18 +1436,14 @@ def validate_precedents(origin: str, receiving: str,
             'cases': []
         }
 
-    # Search with STRICT filter matching
-    matching_cases = search_data_graph_strict(
-        origin=origin,
-        receiving=receiving,
-        purposes=purposes,
-        process_l1=process_l1,
-        process_l2=process_l2,
-        process_l3=process_l3,
-        has_pii=has_pii
-    )
+    # Check assessment compliance
+    if not required_assessments:
+        required_assessments = []
 
-    total_cases = len(matching_cases)
+    total_cases, compliant_count, sample_cases = _precedent_summary(
+        origin, receiving, purposes, process_l1, process_l2, process_l3,
+        has_pii, required_assessments
+    )
 
     if total_cases == 0:
         filters_provided = []
@@ -845,25 +1467,6 @@ def validate_precedents(origin: str, receiving: str,
             'cases': []
         }
 
-    # Check assessment compliance
-    if not required_assessments:
-        required_assessments = []
-
-    compliant_cases = []
-    for case in matching_cases:
-        compliance = evaluate_assessment_compliance(
-            required_assessments,
-            pia_status=case.get('pia_status'),
-            tia_status=case.get('tia_status'),
-            hrpr_status=case.get('hrpr_status'),
-            case_status=case.get('case_status')
-        )
-
-        if compliance['compliant']:
-            compliant_cases.append(case)
-
-    compliant_count = len(compliant_cases)
-
     # DYNAMIC LOGIC: At least ONE compliant case = ALLOWED
     if compliant_count > 0:
         return {
@@ -871,7 +1474,7 @@ def validate_precedents(origin: str, receiving: str,
             'message': f'ALLOWED: Found {total_cases} matching case(s), {compliant_count} have all required assessments completed.',
             'matching_cases': total_cases,
             'compliant_cases': compliant_count,
-            'cases': matching_cases[:5]
+            'cases': sample_cases
         }
 
     # All cases found but none compliant
@@ -880,265 +1483,349 @@ def validate_precedents(origin: str, receiving: str,
         'message': f'PROHIBITED: Found {total_cases} matching case(s) but NONE have all required assessments completed.',
         'matching_cases': total_cases,
         'compliant_cases': 0,
-        'cases': matching_cases[:5]
+        'cases': sample_cases
     }
 
 
-def search_data_graph_strict(origin: str, receiving: str, purposes: List[str] = None,
-                             process_l1: str = None, process_l2: str = None, process_l3: str = None,
-                             has_pii: bool = None) -> List[Dict]:
+@lru_cache(maxsize=64)
+def _build_strict_query(has_origin: bool, has_receiving: bool, has_purposes: bool,
+                        has_process_l1: bool, has_process_l2: bool, has_process_l3: bool,
+                        pii_mode: Optional[bool]) -> str:
     """
-    STRICT precedent search: ALL provided filters must match exactly.
-    ONLY searches cases with valid status (Completed, Complete, Active, Published).
+    Build the STRICT precedent search query for one combination of filters.
+    Only the query shape depends on the filters (values are parameters), so the
+    handful of distinct strings are built once and reused, keeping the graph's
+    plan cache warm.
     """
-    logger.info(f"STRICT search: {origin} -> {receiving}, purposes={purposes}, pii={has_pii}")
+    # The origin is an inline property map, so the planner can seed the
+    # traversal from the Country.name index rather than filtering afterwards
+    origin_pattern = "(origin:Country {name: $origin})" if has_origin else "(origin:Country)"
+
+    # Exact process levels and the receiving country are further patterns on
+    # the same c in one MATCH, so the planner joins them in a single traversal
+    # (and may start from whichever name index is most selective) instead of
+    # testing each as a separate predicate per case. TRANSFERS_TO is expanded
+    # again below to collect the case's full receiving list
+    match_patterns = [f"(c:Case)-[:ORIGINATES_FROM]->{origin_pattern}"]
+    if has_process_l3:
+        match_patterns.append("(c)-[:HAS_PROCESS_L3]->(:ProcessL3 {name: $process_l3})")
+    if has_process_l2:
+        match_patterns.append("(c)-[:HAS_PROCESS_L2]->(:ProcessL2 {name: $process_l2})")
+    if has_process_l1:
+        match_patterns.append("(c)-[:HAS_PROCESS_L1]->(:ProcessL1 {name: $process_l1})")
+    if has_receiving:
+        match_patterns.append("(c)-[:TRANSFERS_TO]->(:Jurisdiction {name: $receiving})")
 
-    # Build valid status list for WHERE clause
-    valid_statuses_str = ', '.join([f"'{s}'" for s in VALID_CASE_STATUSES])
+    # CRITICAL: Only include valid case statuses
+    conditions = ["c.case_status IN $valid_statuses"]
 
-    conditions = []
-    params = {}
+    # PII is a flag stored on the case at ingest (falkor_upload_json.py), so it
+    # is a property check decided before the 1000-case cap
+    if pii_mode is not None:
+        conditions.append(f"{CASE_HAS_PII_CYPHER} = $has_pii")
 
-    if origin:
-        conditions.append("origin.name = $origin")
-        params['origin'] = origin
+    match_clause = ",\n          ".join(match_patterns)
+    where_clause = " AND ".join(conditions)
 
-    if receiving:
-        conditions.append("receiving.name = $receiving")
-        params['receiving'] = receiving
+    # Fragments are collected and joined once rather than grown with +=
+    parts: List[str] = [f"""
+    MATCH {match_clause}
+    WHERE {where_clause}
+    """]
+
+    # Every requested purpose must be present: the case's purpose names are
+    # gathered once per case instead of once per requested purpose
+    if has_purposes:
+        parts.append("""
+    WITH c, origin, [(c)-[:HAS_PURPOSE]->(purpose:Purpose) | purpose.name] as case_purposes
+    WHERE all(p IN $purposes WHERE p IN case_purposes)
+    """)
+
+    # Each collection is a pattern comprehension over the case's own edges:
+    # one projection per case, no intermediate grouping and no cross-products
+    # between the lists (or duplicate rows from multi-valued process levels).
+    # Blank and missing names are dropped here, so the lists arrive clean.
+    # The cap is taken in case id order (case_ref_id for cases loaded by
+    # falkor_upload_json.py, which writes no case_id) before any of that
+    # expansion; nothing below aggregates across cases, so the order is preserved
+    parts.append("""
+    WITH c, origin
+    ORDER BY COALESCE(c.case_id, c.case_ref_id, 'UNKNOWN') ASC
+    LIMIT 1000
+    WITH c, origin,
+         [(c)-[:TRANSFERS_TO]->(recv:Jurisdiction) | recv.name] as receiving_countries,
+         [(c)-[:HAS_PURPOSE]->(purpose:Purpose) | purpose.name] as purposes,
+         head([(c)-[:HAS_PROCESS_L1]->(p1:ProcessL1) | p1.name]) as process_l1,
+         head([(c)-[:HAS_PROCESS_L2]->(p2:ProcessL2) | p2.name]) as process_l2,
+         head([(c)-[:HAS_PROCESS_L3]->(p3:ProcessL3) | p3.name]) as process_l3,
+         [(c)-[:HAS_PERSONAL_DATA]->(pd:PersonalData) WHERE pd.name <> '' | pd.name] as personal_data_items,
+         [(c)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory) WHERE pdc.name <> '' | pdc.name] as pdc_items,
+         [(c)-[:HAS_CATEGORY]->(cat:Category) WHERE cat.name <> '' | cat.name] as categories
+    """)
+
+    # Column order must match PrecedentRow's fields
+    parts.append("""
+    RETURN COALESCE(c.case_id, c.case_ref_id, 'UNKNOWN') as case_id,
+           c.eim_id as eim_id,
+           c.business_app_id as business_app_id,
+           c.app_id as app_id,
+           origin.name as origin_country,
+           receiving_countries,
+           purposes,
+           process_l1,
+           process_l2,
+           process_l3,
+           COALESCE(c.pia_module, c.pia_status, 'N/A') as pia_status,
+           COALESCE(c.tia_module, c.tia_status, 'N/A') as tia_status,
+           COALESCE(c.hrpr_module, c.hrpr_status, 'N/A') as hrpr_status,
+           personal_data_items,
+           pdc_items,
+           categories,
+           c.case_status as case_status,
+           COALESCE(c.has_pii, any(x IN pdc_items WHERE NOT toUpper(trim(x)) IN $pii_na_values)) as has_pii,
+           c.has_health_data as has_health_data,
+           size([a IN $required_assessments WHERE toLower(CASE a
+               WHEN 'PIA' THEN COALESCE(c.pia_module, c.pia_status, 'N/A')
+               WHEN 'TIA' THEN COALESCE(c.tia_module, c.tia_status, 'N/A')
+               WHEN 'HRPR' THEN COALESCE(c.hrpr_module, c.hrpr_status, 'N/A')
+           END) = 'completed']) = size($required_assessments) as is_compliant
+    """)
 
-    # CRITICAL: Only include valid case statuses
-    conditions.append(f"c.case_status IN [{valid_statuses_str}]")
+    return "".join(parts)
 
-    where_clause = " AND ".join(conditions) if conditions else "true"
 
-    query = f"""
-    MATCH (c:Case)-[:ORIGINATES_FROM]->(origin:Country)
-    MATCH (c)-[:TRANSFERS_TO]->(receiving:Jurisdiction)
-    WHERE {where_clause}
+def search_data_graph_strict(origin: str, receiving: str, purposes: List[str] = None,
+                             process_l1: str = None, process_l2: str = None, process_l3: str = None,
+                             has_pii: bool = None,
+                             required_assessments: List[str] = None) -> Iterator[PrecedentRow]:
     """
+    STRICT precedent search: ALL provided filters must match exactly.
+    ONLY searches cases with valid status (Completed, Complete, Active, Published).
+    Each case carries is_compliant: whether all required_assessments are Completed.
 
-    if purposes and len(purposes) > 0:
-        query += """
-    WITH c, origin, receiving
-    MATCH (c)-[:HAS_PURPOSE]->(purpose:Purpose)
-    WITH c, origin, receiving, collect(DISTINCT purpose.name) as case_purposes
-    WHERE ALL(p IN $purposes WHERE p IN case_purposes)
-        """
-        params['purposes'] = purposes
+    Cases are yielded one at a time so callers that only need counts and a
+    small sample never hold the full (up to 1000) case list in memory.
+    Query errors propagate to the caller.
+    """
+    logger.info("STRICT search: %s -> %s, purposes=%s, pii=%s", origin, receiving, purposes, has_pii)
 
+    params = {
+        'valid_statuses': VALID_CASE_STATUSES_PARAM,
+        'pii_na_values': PII_NA_VALUES_PARAM,
+        'required_assessments': required_assessments or []
+    }
+    if origin:
+        params['origin'] = origin
+    if receiving:
+        params['receiving'] = receiving
+    if purposes:
+        params['purposes'] = purposes
     if process_l1:
-        query += """
-    WITH c, origin, receiving
-    MATCH (c)-[:HAS_PROCESS_L1]->(p1:ProcessL1 {name: $process_l1})
-        """
         params['process_l1'] = process_l1
-
     if process_l2:
-        query += """
-    WITH c, origin, receiving
-    MATCH (c)-[:HAS_PROCESS_L2]->(p2:ProcessL2 {name: $process_l2})
-        """
         params['process_l2'] = process_l2
-
     if process_l3:
-        query += """
-    WITH c, origin, receiving
-    MATCH (c)-[:HAS_PROCESS_L3]->(p3:ProcessL3 {name: $process_l3})
-        """
         params['process_l3'] = process_l3
+    if has_pii is not None:
+        params['has_pii'] = bool(has_pii)
 
-    query += """
-    WITH c, origin, receiving LIMIT 1000
-    MATCH (c)-[:TRANSFERS_TO]->(recv:Jurisdiction)
-    WITH c, origin, receiving, collect(DISTINCT recv.name) as receiving_countries
+    query = _build_strict_query(
+        bool(origin), bool(receiving), bool(purposes),
+        bool(process_l1), bool(process_l2), bool(process_l3),
+        has_pii
+    )
 
-    OPTIONAL MATCH (c)-[:HAS_PURPOSE]->(purpose:Purpose)
-    WITH c, origin, receiving, receiving_countries, collect(DISTINCT purpose.name) as purposes
+    result = query_with_timeout(data_graph, query, params=params, context="STRICT precedent search")
 
-    OPTIONAL MATCH (c)-[:HAS_PROCESS_L1]->(p1:ProcessL1)
-    OPTIONAL MATCH (c)-[:HAS_PROCESS_L2]->(p2:ProcessL2)
-    OPTIONAL MATCH (c)-[:HAS_PROCESS_L3]->(p3:ProcessL3)
-    WITH c, origin, receiving, receiving_countries, purposes, p1.name as process_l1, p2.name as process_l2, p3.name as process_l3
+    # Rows are released as they are turned into PrecedentRows, and emitted
+    # lazily so only the consumer decides what to retain
+    emitted = 0
+    for row in _drain_rows(result):
+        # The RETURN clause is fixed and its lists are already free of blanks;
+        # only the low-cardinality names are interned
+        case_data = PrecedentRow(*row)
+        case_data.origin_country = _intern(case_data.origin_country)
+        case_data.receiving_countries = _intern_values(case_data.receiving_countries)
+        case_data.purposes = _intern_values(case_data.purposes)
+        case_data.process_l1 = _intern(case_data.process_l1)
+        case_data.process_l2 = _intern(case_data.process_l2)
+        case_data.process_l3 = _intern(case_data.process_l3)
+        if case_data.has_health_data is None:
+            # Unflagged case (loaded before the flag existed): whole-word keyword scan
+            case_data.has_health_data = contains_health_data(case_data.personal_data,
+                                                             case_data.personal_data_categories)
+        emitted += 1
+        yield case_data
 
-    OPTIONAL MATCH (c)-[:HAS_PERSONAL_DATA]->(pd:PersonalData)
-    WITH c, origin, receiving, receiving_countries, purposes, process_l1, process_l2, process_l3, collect(DISTINCT pd.name) as personal_data_items
+    logger.info("STRICT search found %d exact-match cases (valid status only)", emitted)
 
-    OPTIONAL MATCH (c)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory)
-    WITH c, origin, receiving, receiving_countries, purposes, process_l1, process_l2, process_l3, personal_data_items, collect(DISTINCT pdc.name) as pdc_items
 
-    OPTIONAL MATCH (c)-[:HAS_CATEGORY]->(cat:Category)
-    WITH c, origin, receiving, receiving_countries, purposes, process_l1, process_l2, process_l3, personal_data_items, pdc_items, collect(DISTINCT cat.name) as categories
-    """
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
-    if has_pii is True:
-        query += "WHERE size(pdc_items) > 0 AND NOT ALL(p IN pdc_items WHERE p IN ['N/A', 'NA', 'null'])\n"
-    elif has_pii is False:
-        query += "WHERE size(pdc_items) = 0 OR ALL(p IN pdc_items WHERE p IN ['N/A', 'NA', 'null'])\n"
 
-    query += """
-    RETURN COALESCE(c.case_id, c.case_ref_id, 'UNKNOWN') as case_id,
-           c.eim_id as eim_id,
-           c.business_app_id as business_app_id,
-           c.app_id as app_id,
-           origin.name as origin_country,
-           receiving_countries,
-           purposes,
-           process_l1,
-           process_l2,
-           process_l3,
-           COALESCE(c.pia_module, c.pia_status, 'N/A') as pia_status,
-           COALESCE(c.tia_module, c.tia_status, 'N/A') as tia_status,
-           COALESCE(c.hrpr_module, c.hrpr_status, 'N/A') as hrpr_status,
-           personal_data_items,
-           pdc_items,
-           categories,
-           c.case_status as case_status
-    ORDER BY case_id
-    LIMIT 1000
+def _name_indexes(*labels: str) -> Dict[str, Dict]:
+    """
+    Trigram inverted indexes over the names of small vocabulary labels
+    (Country, Jurisdiction), kept in the query cache so they follow CACHE_TTL
+    and /api/cache/clear. Labels missing from the cache are loaded in one
+    query_many batch.
+    """
+    indexes = {label: get_cached_result(f"name_index:{label}") for label in labels}
+    missing = [label for label, index in indexes.items() if index is None]
+    if missing:
+        results = query_many(data_graph, [(f"MATCH (n:{label}) RETURN DISTINCT n.name", None)
+                                          for label in missing],
+                             context="Name indexes")
+        for label, result in zip(missing, results):
+            names = [n for n in _first_column(result) if n]
+            grams = defaultdict(set)
+            for name in names:
+                for gram in _trigrams(name.lower()):
+                    grams[gram].add(name)
+            index = {'names': names, 'grams': dict(grams)}
+            set_cached_result(f"name_index:{label}", index)
+            indexes[label] = index
+    return indexes
+
+
+def _name_index(label: str) -> Dict:
+    return _name_indexes(label)[label]
+
+
+def _contains_in_order(text: str, fragments: List[str]) -> bool:
+    """Whether every fragment occurs in text, each after the end of the previous one"""
+    pos = 0
+    for fragment in fragments:
+        pos = text.find(fragment, pos)
+        if pos < 0:
+            return False
+        pos += len(fragment)
+    return True
+
+
+def _names_containing(label: str, fragments: List[str]) -> List[str]:
+    """
+    Names of label containing every fragment, in order: the trigram posting
+    sets of all fragments are intersected, then the candidates verified
     """
+    index = _name_index(label)
+    grams = set().union(*map(_trigrams, fragments))
+    if grams:
+        postings = sorted((index['grams'].get(g, ()) for g in grams), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+    else:
+        candidates = index['names']
+    return sorted(name for name in candidates if _contains_in_order(name.lower(), fragments))
 
-    try:
-        result = query_with_timeout(data_graph, query, params=params, context="STRICT precedent search")
-
-        cases = []
-        if result.result_set:
-            for row in result.result_set:
-                purposes_list = row[6] if len(row) > 6 and row[6] else []
-                process_l1 = row[7] if len(row) > 7 else None
-                process_l2 = row[8] if len(row) > 8 else None
-                process_l3 = row[9] if len(row) > 9 else None
-                personal_data_items = row[13] if len(row) > 13 and row[13] else []
-                pdc_items = row[14] if len(row) > 14 and row[14] else []
-                categories = row[15] if len(row) > 15 and row[15] else []
-
-                purposes_list = [p for p in purposes_list if p] if purposes_list else []
-                personal_data_items = [pd for pd in personal_data_items if pd] if personal_data_items else []
-                pdc_items = [pdc for pdc in pdc_items if pdc] if pdc_items else []
-                categories = [cat for cat in categories if cat] if categories else []
-
-                has_health = contains_health_data(personal_data_items, pdc_items)
-                has_pii_flag = has_pii_data(pdc_items)
-
-                case_data = {
-                    'case_id': row[0],
-                    'eim_id': row[1],
-                    'business_app_id': row[2],
-                    'app_id': row[3] if len(row) > 3 else None,
-                    'origin_country': row[4],
-                    'receiving_countries': row[5] if isinstance(row[5], list) else [row[5]] if row[5] else [],
-                    'purposes': purposes_list,
-                    'process_l1': process_l1,
-                    'process_l2': process_l2,
-                    'process_l3': process_l3,
-                    'pia_status': row[10],
-                    'tia_status': row[11],
-                    'hrpr_status': row[12],
-                    'personal_data': personal_data_items,
-                    'personal_data_categories': pdc_items,
-                    'categories': categories,
-                    'case_status': row[16] if len(row) > 16 else 'Unknown',
-                    'has_pii': has_pii_flag,
-                    'has_health_data': has_health
-                }
-                cases.append(case_data)
 
-        logger.info(f"STRICT search found {len(cases)} exact-match cases (valid status only)")
-        return cases
+def _names_starting_with(label: str, prefix: str) -> List[str]:
+    """Names of label starting with prefix (case-insensitive), from the cached vocabulary"""
+    return sorted(name for name in _name_index(label)['names'] if name.lower().startswith(prefix))
 
-    except Exception as e:
-        logger.error(f"Error in strict precedent search: {e}", exc_info=True)
-        return []
+
+def _name_match_condition(alias: str, label: str, param: str, value: str, params: Dict) -> str:
+    """
+    Case-insensitive name predicate on the indexed name property.
+    Plain input is a prefix match; '*' is a wildcard, so the input matches
+    names containing its '*'-separated fragments in order (through the
+    trigram index). Either way the input is resolved against the cached
+    vocabulary into exact names, so the graph does an index lookup on name
+    instead of scanning or filtering the label. The vocabulary follows
+    CACHE_TTL: newly loaded countries become searchable once it refreshes,
+    or straight away after /api/cache/clear.
+    """
+    needle = _norm(value)
+    if '*' in needle:
+        params[param] = _names_containing(label, [f for f in needle.split('*') if f])
+    else:
+        params[param] = _names_starting_with(label, needle)
+    return f"{alias}.name IN ${param}"
 
 
 def search_data_graph(origin: str, receiving: str, purposes: List[str] = None,
                       process_l1: str = None, process_l2: str = None, process_l3: str = None,
-                      has_pii: str = None) -> List[Dict]:
-    """Query DataTransferGraph for matching cases (partial match for UI search)"""
-    logger.info(f"Searching DataTransferGraph: {origin} -> {receiving}")
+                      has_pii: str = None) -> Iterator[CaseRow]:
+    """
+    Query DataTransferGraph for matching cases (partial match for UI search).
+    Cases are yielded one at a time, like search_data_graph_strict.
+    """
+    logger.info("Searching DataTransferGraph: %s -> %s", origin, receiving)
 
-    valid_statuses_str = ', '.join([f"'{s}'" for s in VALID_CASE_STATUSES])
+    # filter name -> predicate; joined below in SEARCH_FILTER_ORDER
+    conditions = {}
+    params = {'valid_statuses': VALID_CASE_STATUSES_PARAM, 'pii_na_values': PII_NA_VALUES_PARAM}
 
-    conditions = []
-    params = {}
+    # Both country filters set: load any uncached vocabulary in one batch
+    if origin and receiving:
+        _name_indexes('Country', 'Jurisdiction')
 
     if origin:
-        conditions.append("toLower(origin.name) CONTAINS toLower($origin)")
-        params['origin'] = origin.lower()
+        conditions['origin'] = _name_match_condition('origin', 'Country', 'origin', origin, params)
 
     if receiving:
-        conditions.append("toLower(receiving.name) CONTAINS toLower($receiving)")
-        params['receiving'] = receiving.lower()
-
-    # Only include valid case statuses
-    conditions.append(f"c.case_status IN [{valid_statuses_str}]")
-
-    where_clause = " AND ".join(conditions) if conditions else "true"
-
-    query = f"""
-    MATCH (c:Case)-[:ORIGINATES_FROM]->(origin:Country)
-    MATCH (c)-[:TRANSFERS_TO]->(receiving:Jurisdiction)
-    WHERE {where_clause}
-    """
-
-    if purposes and len(purposes) > 0:
-        query += """
-    WITH c, origin
-    MATCH (c)-[:HAS_PURPOSE]->(purpose:Purpose)
-    WHERE purpose.name IN $purposes
-        """
+        conditions['receiving'] = _name_match_condition('receiving', 'Jurisdiction', 'receiving', receiving, params)
+
+    # PII filter reads the flag stored on the case at ingest, so non-matching
+    # cases are never expanded
+    if has_pii in ('yes', 'no'):
+        conditions['pii'] = f"{CASE_HAS_PII_CYPHER} = $has_pii"
+        params['has_pii'] = has_pii == 'yes'
+
+    # Purpose/process filters are existence checks in the same WHERE, so the
+    # planner sees one flat pipeline instead of a WITH/MATCH barrier per filter
+    if purposes:
+        conditions['purposes'] = "size([(c)-[:HAS_PURPOSE]->(purpose:Purpose) WHERE purpose.name IN $purposes | purpose]) > 0"
         params['purposes'] = purposes
 
     if process_l1:
-        query += """
-    WITH c, origin
-    MATCH (c)-[:HAS_PROCESS_L1]->(p1:ProcessL1 {name: $process_l1})
-        """
+        conditions['process_l1'] = "(c)-[:HAS_PROCESS_L1]->(:ProcessL1 {name: $process_l1})"
         params['process_l1'] = process_l1
 
     if process_l2:
-        query += """
-    WITH c, origin
-    MATCH (c)-[:HAS_PROCESS_L2]->(p2:ProcessL2 {name: $process_l2})
-        """
+        conditions['process_l2'] = "(c)-[:HAS_PROCESS_L2]->(:ProcessL2 {name: $process_l2})"
         params['process_l2'] = process_l2
 
     if process_l3:
-        query += """
-    WITH c, origin
-    MATCH (c)-[:HAS_PROCESS_L3]->(p3:ProcessL3 {name: $process_l3})
-        """
+        conditions['process_l3'] = "(c)-[:HAS_PROCESS_L3]->(:ProcessL3 {name: $process_l3})"
         params['process_l3'] = process_l3
 
-    query += """
-    WITH c, origin LIMIT 1000
-    MATCH (c)-[:TRANSFERS_TO]->(receiving:Jurisdiction)
-    WITH c, origin, collect(DISTINCT receiving.name) as receiving_countries
-
-    OPTIONAL MATCH (c)-[:HAS_PURPOSE]->(purpose:Purpose)
-    WITH c, origin, receiving_countries, collect(DISTINCT purpose.name) as purposes
-
-    OPTIONAL MATCH (c)-[:HAS_PROCESS_L1]->(p1:ProcessL1)
-    OPTIONAL MATCH (c)-[:HAS_PROCESS_L2]->(p2:ProcessL2)
-    OPTIONAL MATCH (c)-[:HAS_PROCESS_L3]->(p3:ProcessL3)
-    WITH c, origin, receiving_countries, purposes, p1.name as process_l1, p2.name as process_l2, p3.name as process_l3
+    conditions = [conditions[name] for name in SEARCH_FILTER_ORDER if name in conditions]
 
-    OPTIONAL MATCH (c)-[:HAS_PERSONAL_DATA]->(pd:PersonalData)
-    WITH c, origin, receiving_countries, purposes, process_l1, process_l2, process_l3, collect(DISTINCT pd.name) as personal_data_items
-
-    OPTIONAL MATCH (c)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory)
-    WITH c, origin, receiving_countries, purposes, process_l1, process_l2, process_l3, personal_data_items, collect(DISTINCT pdc.name) as pdc_items
-
-    OPTIONAL MATCH (c)-[:HAS_CATEGORY]->(cat:Category)
-    WITH c, origin, receiving_countries, purposes, process_l1, process_l2, process_l3, personal_data_items, pdc_items, collect(DISTINCT cat.name) as categories
-    """
+    # CRITICAL: Only include valid case statuses
+    where_clause = " AND ".join(["c.case_status IN $valid_statuses"] + conditions)
+
+    # One MATCH, so the planner can seed the traversal from the Country or
+    # Jurisdiction name index when a country filter resolved to exact names,
+    # and from the Case.case_status index otherwise
+    parts: List[str] = [f"""
+    MATCH (c:Case)-[:ORIGINATES_FROM]->(origin:Country),
+          (c)-[:TRANSFERS_TO]->(receiving:Jurisdiction)
+    WHERE {where_clause}
+    """]
 
-    if has_pii == 'yes':
-        query += "WHERE size(pdc_items) > 0 AND NOT ALL(p IN pdc_items WHERE p IN ['N/A', 'NA', 'null'])\n"
-    elif has_pii == 'no':
-        query += "WHERE size(pdc_items) = 0 OR ALL(p IN pdc_items WHERE p IN ['N/A', 'NA', 'null'])\n"
+    parts.append("""
+    // Sort the lean (c, origin) rows once and cap them before any fan-out;
+    // nothing below aggregates across cases, so this order is preserved
+    WITH DISTINCT c, origin
+    ORDER BY COALESCE(c.case_id, c.case_ref_id, 'UNKNOWN') ASC
+    LIMIT 1000
 
-    query += """
+    // Each list is a pattern comprehension over the case's own edges: one
+    // projection per case with no subquery scope, grouping or DISTINCT pass,
+    // and blank names are dropped here so the lists arrive clean
+    WITH c, origin,
+         [(c)-[:TRANSFERS_TO]->(recv:Jurisdiction) | recv.name] as receiving_countries,
+         [(c)-[:HAS_PURPOSE]->(purpose:Purpose) | purpose.name] as purposes,
+         head([(c)-[:HAS_PROCESS_L1]->(p1:ProcessL1) | p1.name]) as process_l1,
+         head([(c)-[:HAS_PROCESS_L2]->(p2:ProcessL2) | p2.name]) as process_l2,
+         head([(c)-[:HAS_PROCESS_L3]->(p3:ProcessL3) | p3.name]) as process_l3,
+         [(c)-[:HAS_PERSONAL_DATA]->(pd:PersonalData) WHERE pd.name <> '' | pd.name] as personal_data_items,
+         [(c)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory) WHERE pdc.name <> '' | pdc.name] as pdc_items,
+         [(c)-[:HAS_CATEGORY]->(cat:Category) WHERE cat.name <> '' | cat.name] as categories
+    """)
+
+    parts.append("""
     RETURN COALESCE(c.case_id, c.case_ref_id, 'UNKNOWN') as case_id,
            c.eim_id as eim_id,
            c.business_app_id as business_app_id,
@@ -1154,68 +1841,66 @@ def search_data_graph(origin: str, receiving: str, purposes: List[str] = None,
            personal_data_items,
            pdc_items,
            categories,
-           c.case_status as case_status
-    ORDER BY case_id
-    LIMIT 1000
-    """
+           c.case_status as case_status,
+           COALESCE(c.has_pii, any(x IN pdc_items WHERE NOT toUpper(trim(x)) IN $pii_na_values)) as has_pii,
+           c.has_health_data as has_health_data
+    """)
+    query = "".join(parts)
 
     try:
         result = query_with_timeout(data_graph, query, params=params, context="UI case search")
+        rows = result.result_set or []
+        del result
+
+        # Columnar transform: the rows are transposed once and the vocabulary
+        # columns get one interning pass each (the personal-data lists arrive
+        # free of blanks), then the columns are zipped back into CaseRows
+        emitted = len(rows)
+        if rows:
+            (case_ids, eim_ids, business_app_ids, origins, receivings,
+             purposes, process_l1s, process_l2s, process_l3s,
+             pia_modules, tia_modules, hrpr_modules,
+             personal_data, pdc_items, categories, case_statuses,
+             pii_flags, health_flags) = zip(*rows)
+            del rows
+
+            # The PII flag is final; a null health flag (case loaded before
+            # the flag existed) gets the whole-word keyword scan
+            health_flags = [
+                contains_health_data(pd, pdc) if flag is None else flag
+                for flag, pd, pdc in zip(health_flags, personal_data, pdc_items)
+            ]
+            yield from map(
+                CaseRow,
+                case_ids, eim_ids, business_app_ids,
+                map(_intern, origins),
+                map(_intern_values, receivings),
+                map(_intern_values, purposes),
+                map(_intern, process_l1s), map(_intern, process_l2s), map(_intern, process_l3s),
+                pia_modules, tia_modules, hrpr_modules,
+                personal_data, pdc_items, categories,
+                map(bool, pii_flags),
+                map(bool, health_flags),
+                [status or 'Unknown' for status in case_statuses]
+            )
 
-        cases = []
-        if result.result_set:
-            for row in result.result_set:
-                purposes = row[5] if len(row) > 5 and row[5] else []
-                process_l1 = row[6] if len(row) > 6 else None
-                process_l2 = row[7] if len(row) > 7 else None
-                process_l3 = row[8] if len(row) > 8 else None
-                personal_data_items = row[12] if len(row) > 12 and row[12] else []
-                pdc_items = row[13] if len(row) > 13 and row[13] else []
-                categories = row[14] if len(row) > 14 and row[14] else []
-
-                purposes = [p for p in purposes if p] if purposes else []
-                personal_data_items = [pd for pd in personal_data_items if pd] if personal_data_items else []
-                pdc_items = [pdc for pdc in pdc_items if pdc] if pdc_items else []
-                categories = [cat for cat in categories if cat] if categories else []
-
-                has_health = contains_health_data(personal_data_items, pdc_items)
-                has_pii_flag = has_pii_data(pdc_items)
-
-                case_data = {
-                    'case_id': row[0],
-                    'eim_id': row[1],
-                    'business_app_id': row[2],
-                    'origin_country': row[3],
-                    'receiving_countries': row[4] if isinstance(row[4], list) else [row[4]] if row[4] else [],
-                    'purposes': purposes,
-                    'process_l1': process_l1,
-                    'process_l2': process_l2,
-                    'process_l3': process_l3,
-                    'pia_module': row[9],
-                    'tia_module': row[10],
-                    'hrpr_module': row[11],
-                    'personal_data': personal_data_items,
-                    'personal_data_categories': pdc_items,
-                    'categories': categories,
-                    'case_status': row[15] if len(row) > 15 else 'Unknown',
-                    'has_pii': has_pii_flag,
-                    'has_health_data': has_health
-                }
-                cases.append(case_data)
-
-        logger.info(f"Found {len(cases)} cases in DataTransferGraph (valid status only)")
-        return cases
+        logger.info("Found %d cases in DataTransferGraph (valid status only)", emitted)
 
     except Exception as e:
         logger.error(f"Error querying DataTransferGraph: {e}", exc_info=True)
-        return []
 
 
 def get_all_rules_overview() -> Dict:
     """
     Get all rules for business user overview.
     Returns rules organized by type with aggregated information.
+    The assembled overview is cached for CACHE_TTL (cleared by /api/cache/clear).
     """
+    cached = get_cached_result("rules_overview")
+    if cached is not None:
+        return cached
+
+    overview_complete = True
     permission_rules = []
     prohibition_rules = []
     country_specific_rules = []
@@ -1223,20 +1908,22 @@ def get_all_rules_overview() -> Dict:
     # Get prohibition rules from config
     if PROHIBITION_CONFIG and 'prohibition_rules' in PROHIBITION_CONFIG:
         for rule_name, rule_config in PROHIBITION_CONFIG['prohibition_rules'].items():
-            if not rule_config.get('enabled', True):
+            get = rule_config.get
+            if not get('enabled', True):
                 continue
 
+            priority = COUNTRY_RULE_PRIORITY + get('priority', 0)
             rule_overview = {
-                'rule_id': rule_config.get('rule_id', rule_name),
-                'name': rule_config.get('prohibition_name', rule_name),
-                'description': rule_config.get('description', ''),
+                'rule_id': get('rule_id', rule_name),
+                'name': get('prohibition_name', rule_name),
+                'description': get('description', ''),
                 'rule_type': 'Prohibition',
-                'priority': COUNTRY_RULE_PRIORITY + rule_config.get('priority', 0),
-                'origin_countries': rule_config.get('origin_countries', []),
-                'receiving_countries': rule_config.get('receiving_countries', []),
-                'requires_pii': rule_config.get('requires_pii', False),
-                'requires_health_data': rule_config.get('requires_health_data', False),
-                'duties': rule_config.get('duties', []),
+                'priority': priority,
+                'origin_countries': get('origin_countries', []),
+                'receiving_countries': get('receiving_countries', []),
+                'requires_pii': get('requires_pii', False),
+                'requires_health_data': get('requires_health_data', False),
+                'duties': get('duties', []),
                 'is_country_specific': True
             }
             country_specific_rules.append(rule_overview)
@@ -1252,6 +1939,8 @@ def get_all_rules_overview() -> Dict:
         OPTIONAL MATCH (prohib)-[:CAN_HAVE_DUTY]->(prohib_duty:Duty)
         OPTIONAL MATCH (r)-[:TRIGGERED_BY_ORIGIN]->(origin_group:CountryGroup)
         OPTIONAL MATCH (r)-[:TRIGGERED_BY_RECEIVING]->(recv_group:CountryGroup)
+        WITH r, perm, perm_duty, prohib, prohib_duty, origin_group, recv_group
+        WHERE perm IS NOT NULL OR prohib IS NOT NULL
         RETURN r.rule_id as rule_id,
                r.description as description,
                r.priority as priority,
@@ -1266,92 +1955,171 @@ def get_all_rules_overview() -> Dict:
         ORDER BY r.priority
         """
 
-        result = query_with_timeout(
-            rules_graph, query,
-            context="Get rules overview",
-            use_cache=True,
-            cache_key="rules_overview"
-        )
+        result = query_with_timeout(rules_graph, query, context="Get rules overview")
+
+        rows = result.result_set
+        if rows:
+            perm_append = permission_rules.append
+            prohib_append = prohibition_rules.append
+            for row in rows:
+                (rule_id, description, priority, requires_pii, requires_health_data,
+                 permission_name, perm_duties, prohibition_name, prohib_duties,
+                 origin_groups, receiving_groups) = row
+                if not (permission_name or prohibition_name):
+                    continue
 
-        if result.result_set:
-            for row in result.result_set:
-                rule_id = row[0]
-                description = row[1]
-                priority = row[2] or 0
-                requires_pii = row[3] or False
-                requires_health_data = row[4] or False
-                permission_name = row[5]
-                perm_duties = [d for d in (row[6] or []) if d]
-                prohibition_name = row[7]
-                prohib_duties = [d for d in (row[8] or []) if d]
-                origin_groups = [g for g in (row[9] or []) if g]
-                receiving_groups = [g for g in (row[10] or []) if g]
+                origin_groups = list(filter(None, origin_groups or ()))
+                receiving_groups = list(filter(None, receiving_groups or ()))
+
+                # Fields shared by the permission and prohibition entries of a rule
+                base = {
+                    'rule_id': rule_id,
+                    'description': description,
+                    'priority': priority or 0,
+                    'origin_countries': origin_groups,
+                    'receiving_countries': receiving_groups,
+                    'requires_pii': requires_pii or False,
+                    'requires_health_data': requires_health_data or False,
+                    'is_country_specific': False
+                }
 
                 if permission_name:
-                    rule_overview = {
-                        'rule_id': rule_id,
+                    perm_append({
+                        **base,
                         'name': permission_name,
-                        'description': description,
                         'rule_type': 'Permission',
-                        'priority': priority,
-                        'origin_countries': origin_groups,
-                        'receiving_countries': receiving_groups,
-                        'requires_pii': requires_pii,
-                        'requires_health_data': requires_health_data,
-                        'duties': perm_duties,
-                        'is_country_specific': False
-                    }
-                    permission_rules.append(rule_overview)
+                        'duties': list(filter(None, perm_duties or ()))
+                    })
 
                 if prohibition_name:
-                    rule_overview = {
-                        'rule_id': rule_id,
+                    prohib_append({
+                        **base,
                         'name': prohibition_name,
-                        'description': description,
                         'rule_type': 'Prohibition',
-                        'priority': priority,
-                        'origin_countries': origin_groups,
-                        'receiving_countries': receiving_groups,
-                        'requires_pii': requires_pii,
-                        'requires_health_data': requires_health_data,
-                        'duties': prohib_duties,
-                        'is_country_specific': False
-                    }
-                    prohibition_rules.append(rule_overview)
+                        'duties': list(filter(None, prohib_duties or ()))
+                    })
 
     except Exception as e:
         logger.error(f"Error getting rules overview: {e}")
+        overview_complete = False
 
-    return {
+    overview = {
         'permission_rules': permission_rules,
         'prohibition_rules': prohibition_rules,
         'country_specific_rules': country_specific_rules,
         'total_rules': len(permission_rules) + len(prohibition_rules)
     }
 
+    # Don't pin a partial overview (graph unavailable) for the whole TTL
+    if overview_complete:
+        set_cached_result("rules_overview", overview)
+
+    return overview
+
+
+# ============================================================================
+# STARTUP
+# ============================================================================
+
+def _ensure_indexes(graph, indexes) -> List[str]:
+    """Create any missing indexes; existing ones are skipped. Returns those created."""
+    created = []
+    for label, property_name in indexes:
+        try:
+            graph.query(f"CREATE INDEX FOR (n:{label}) ON (n.{property_name})")
+            created.append(f"{label}.{property_name}")
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "already indexed" not in error_msg and "already exists" not in error_msg:
+                logger.warning(f"Could not create index {label}.{property_name}: {e}")
+    return created
+
+
+@app.on_event("startup")
+async def ensure_indexes():
+    """Make sure the indexes the API's queries rely on exist (idempotent)"""
+    for graph_name, graph, indexes in (("DataTransferGraph", data_graph, DATA_GRAPH_INDEXES),
+                                       ("RulesGraph", rules_graph, RULES_GRAPH_INDEXES)):
+        created = await run_in_query_pool(_ensure_indexes, graph, indexes)
+        if created:
+            logger.info("Created indexes on %s: %s", graph_name, ', '.join(created))
+        else:
+            logger.info("All %d indexes present on %s", len(indexes), graph_name)
+
+
+async def _timed_warm(name: str, awaitable):
+    """Await one warm-up step, logging how long it took (failures are logged, not raised)"""
+    start = time.perf_counter()
+    try:
+        await awaitable
+        logger.info("Cache warm: %s in %.0fms", name, (time.perf_counter() - start) * 1000)
+    except Exception as e:
+        logger.warning(f"Cache warm: {name} failed after {(time.perf_counter() - start) * 1000:.0f}ms - {e}")
+
+
+@app.on_event("startup")
+async def warm_cache():
+    """
+    Populate the metadata, rules overview and country name-index caches before
+    the first request, so the dashboard's initial burst of lookups is served
+    from cache.
+    """
+    start = time.perf_counter()
+    await asyncio.gather(
+        _timed_warm("dropdown values", get_all_dropdown_values()),
+        _timed_warm("countries", get_countries()),
+        _timed_warm("purposes", get_purposes()),
+        _timed_warm("processes", get_processes()),
+        _timed_warm("rules overview", run_in_query_pool(get_all_rules_overview)),
+        _timed_warm("country name indexes", run_in_query_pool(_name_indexes, 'Country', 'Jurisdiction'))
+    )
+    logger.info("Cache warm-up finished in %.0fms", (time.perf_counter() - start) * 1000)
+
 
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
 
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Set DEV_RELOAD=1 to re-read templates on every request while editing them
+DEV_RELOAD = bool(os.environ.get("DEV_RELOAD"))
+
+
+def _load_template(filename: str, title: str) -> bytes:
+    """Read a template once; a missing file yields a short placeholder page"""
+    template_path = TEMPLATES_DIR / filename
+    if template_path.exists():
+        return template_path.read_bytes()
+    return f"<h1>{title} template not found</h1><p>Expected at: templates/{filename}</p>".encode('utf-8')
+
+
+_INDEX_HTML = _load_template("dashboard.html", "Dashboard")
+_RULES_HTML = _load_template("rules_overview.html", "Rules Overview")
+
+
 @app.get("/", response_class=HTMLResponse, tags=["Frontend"])
 async def index():
     """Serve the dashboard HTML"""
-    template_path = Path(__file__).parent / "templates" / "dashboard.html"
-    if template_path.exists():
-        return template_path.read_text()
-    else:
-        return "<h1>Dashboard template not found</h1><p>Expected at: templates/dashboard.html</p>"
+    if DEV_RELOAD:
+        return HTMLResponse(content=_load_template("dashboard.html", "Dashboard"))
+    return HTMLResponse(content=_INDEX_HTML)
 
 
 @app.get("/rules", response_class=HTMLResponse, tags=["Frontend"])
 async def rules_page():
     """Serve the Rules Overview page for business users"""
-    template_path = Path(__file__).parent / "templates" / "rules_overview.html"
-    if template_path.exists():
-        return template_path.read_text()
-    else:
-        return "<h1>Rules Overview template not found</h1><p>Expected at: templates/rules_overview.html</p>"
+    if DEV_RELOAD:
+        return HTMLResponse(content=_load_template("rules_overview.html", "Rules Overview"))
+    return HTMLResponse(content=_RULES_HTML)
+
+
+def _json_response(payload: Dict):
+    """
+    Hand a JSON payload straight to orjson, skipping FastAPI's response-model
+    validation and jsonable_encoder walk (the response_model still documents it)
+    """
+    return ORJSONResponse(content=payload) if USE_ORJSON else payload
 
 
 @app.get("/api/rules-overview", response_model=RulesOverviewResponse, tags=["Rules"])
@@ -1362,14 +2130,14 @@ async def get_rules_overview():
     with aggregated information suitable for display in accordions.
     """
     try:
-        overview = get_all_rules_overview()
-        return {
+        overview = await run_in_query_pool(get_all_rules_overview)
+        return _json_response({
             'success': True,
             'total_rules': overview['total_rules'],
             'permission_rules': overview['permission_rules'],
             'prohibition_rules': overview['prohibition_rules'],
             'country_specific_rules': overview['country_specific_rules']
-        }
+        })
     except Exception as e:
         logger.error(f"Error getting rules overview: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1379,10 +2147,16 @@ async def get_rules_overview():
 async def get_purposes():
     """Get all available legal processing purposes from the graph"""
     try:
+        # The assembled response is cached, so a hit never reaches the query pool
+        cached = get_cached_result("metadata:purposes")
+        if cached is not None:
+            return _json_response(cached)
+
         query = "MATCH (p:Purpose) RETURN DISTINCT p.name as name ORDER BY name"
-        result = query_with_timeout(data_graph, query, context="Get purposes", use_cache=True, cache_key="purposes")
-        purposes = [row[0] for row in result.result_set] if result.result_set else []
-        return {'success': True, 'purposes': purposes}
+        result = await query_async(data_graph, query, context="Get purposes")
+        response = {'success': True, 'purposes': _first_column(result)}
+        set_cached_result("metadata:purposes", response)
+        return _json_response(response)
     except Exception as e:
         logger.error(f"Error fetching purposes: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1392,19 +2166,30 @@ async def get_purposes():
 async def get_processes():
     """Get all available process levels (L1, L2, L3) from the graph"""
     try:
-        query_l1 = "MATCH (p:ProcessL1) RETURN DISTINCT p.name as name ORDER BY name"
-        result_l1 = query_with_timeout(data_graph, query_l1, context="Get ProcessL1", use_cache=True, cache_key="process_l1")
-        process_l1 = [row[0] for row in result_l1.result_set] if result_l1.result_set else []
-
-        query_l2 = "MATCH (p:ProcessL2) RETURN DISTINCT p.name as name ORDER BY name"
-        result_l2 = query_with_timeout(data_graph, query_l2, context="Get ProcessL2", use_cache=True, cache_key="process_l2")
-        process_l2 = [row[0] for row in result_l2.result_set] if result_l2.result_set else []
-
-        query_l3 = "MATCH (p:ProcessL3) RETURN DISTINCT p.name as name ORDER BY name"
-        result_l3 = query_with_timeout(data_graph, query_l3, context="Get ProcessL3", use_cache=True, cache_key="process_l3")
-        process_l3 = [row[0] for row in result_l3.result_set] if result_l3.result_set else []
+        cached = get_cached_result("metadata:processes")
+        if cached is not None:
+            return _json_response(cached)
 
-        return {'success': True, 'process_l1': process_l1, 'process_l2': process_l2, 'process_l3': process_l3}
+        # One round-trip for all three levels: each branch tags its names with
+        # the level they belong to
+        query = """
+        MATCH (p:ProcessL1) RETURN DISTINCT 'process_l1' AS k, p.name AS n
+        UNION ALL MATCH (p:ProcessL2) RETURN DISTINCT 'process_l2' AS k, p.name AS n
+        UNION ALL MATCH (p:ProcessL3) RETURN DISTINCT 'process_l3' AS k, p.name AS n
+        """
+        result = await query_async(data_graph, query, context="Get processes")
+
+        buckets = defaultdict(list)
+        for k, n in result.result_set or ():
+            if n is not None:
+                buckets[k].append(n)
+        process_l1 = sorted(buckets['process_l1'])
+        process_l2 = sorted(buckets['process_l2'])
+        process_l3 = sorted(buckets['process_l3'])
+
+        response = {'success': True, 'process_l1': process_l1, 'process_l2': process_l2, 'process_l3': process_l3}
+        set_cached_result("metadata:processes", response)
+        return _json_response(response)
     except Exception as e:
         logger.error(f"Error fetching processes: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1414,30 +2199,92 @@ async def get_processes():
 async def get_countries():
     """Get all unique countries from the data graph"""
     try:
-        query_origin = "MATCH (c:Country) RETURN DISTINCT c.name as name ORDER BY name"
-        result_origin = query_with_timeout(data_graph, query_origin, context="Get origin countries", use_cache=True, cache_key="origin_countries")
+        cached = get_cached_result("metadata:countries")
+        if cached is not None:
+            return _json_response(cached)
 
-        query_receiving = "MATCH (j:Jurisdiction) RETURN DISTINCT j.name as name ORDER BY name"
-        result_receiving = query_with_timeout(data_graph, query_receiving, context="Get receiving countries", use_cache=True, cache_key="receiving_countries")
+        # One round-trip: each branch tags its names with their source
+        query = """
+        MATCH (c:Country) RETURN DISTINCT 'o' AS src, c.name AS name
+        UNION ALL MATCH (j:Jurisdiction) RETURN DISTINCT 'r' AS src, j.name AS name
+        """
+        result = await query_async(data_graph, query, context="Get countries")
 
-        origin_countries = [row[0] for row in result_origin.result_set] if result_origin.result_set else []
-        receiving_countries = [row[0] for row in result_receiving.result_set] if result_receiving.result_set else []
+        origin_countries = []
+        receiving_countries = []
+        for src, name in result.result_set or ():
+            if name is not None:
+                (origin_countries if src == 'o' else receiving_countries).append(name)
+        origin_countries.sort()
+        receiving_countries.sort()
 
-        all_countries = sorted(list(set(origin_countries + receiving_countries)))
+        all_countries = _merge_unique(origin_countries, receiving_countries)
 
-        return {
+        response = {
             'success': True,
             'countries': all_countries,
             'origin_countries': origin_countries,
             'receiving_countries': receiving_countries
         }
+        set_cached_result("metadata:countries", response)
+        return _json_response(response)
     except Exception as e:
         logger.error(f"Error fetching countries: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/evaluate-rules", tags=["Compliance"])
-async def evaluate_rules(request: RulesEvaluationRequest):
+# Rules result for transfers no rule can trigger; shared, so never mutated
+_NO_RULES_RESULT = {
+    'triggered_rules': (),
+    'total_rules_triggered': 0,
+    'has_prohibitions': False,
+    'has_country_prohibition': False,
+    'consolidated_duties': (),
+    'required_assessments': ()
+}
+
+
+def _evaluate_triggered_rules(request: RulesEvaluationRequest):
+    """Detect health data and query the triggered rules for an evaluation request"""
+    has_health_data_detected = False
+    if request.other_metadata:
+        has_health_data_detected = get_cached_result(request.health_cache_key)
+        if has_health_data_detected is None:
+            health_detection_details = detect_health_data_from_metadata(request.other_metadata, verbose=True)
+            has_health_data_detected = health_detection_details['detected']
+            set_cached_result(request.health_cache_key, has_health_data_detected)
+
+    has_pii = request.pii
+    origin = request.origin_country
+    receiving = request.receiving_country
+
+    logger.info("Evaluating: %s -> %s, PII=%s, Health=%s",
+                origin, receiving, has_pii, has_health_data_detected)
+
+    if (ENABLE_SAME_COUNTRY_FAST_PATH and origin.casefold() == receiving.casefold()
+            and not _domestic_rules_possible(_RULES_GRAPH_VERSION, _rules_ttl_bucket())
+            and check_country_specific_prohibition(origin, receiving, has_pii, has_health_data_detected) is None):
+        # Same-country transfer, no graph rule can match one and no config
+        # prohibition applies
+        logger.info("Same-country transfer (%s): skipping RulesGraph evaluation", origin)
+        rules_result = _NO_RULES_RESULT
+    else:
+        # Query triggered rules (includes country-specific check)
+        rules_result = query_triggered_rules_deontic(origin, receiving, has_pii, has_health_data_detected)
+
+    return has_health_data_detected, rules_result
+
+
+def _evaluation_response(verbose: bool, response: Dict):
+    """Drop the bulky rule/duty listings from an evaluation response unless verbose"""
+    if not verbose:
+        del response['triggered_rules']
+        del response['consolidated_duties']
+    return _json_response(response)
+
+
+@app.post("/api/evaluate-rules", tags=["Compliance"], responses={200: {"model": RulesEvaluationResponse}})
+async def evaluate_rules(request: RulesEvaluationRequest, verbose: bool = True):
     """
     Evaluate compliance rules with precedent validation and assessment compliance.
 
@@ -1450,40 +2297,43 @@ async def evaluate_rules(request: RulesEvaluationRequest):
 
     Note: Country-specific rules (e.g., US to China) take precedence over PIA/TIA/HRPR
     assessments. Even with completed assessments, country rules can block transfers.
+
+    Pass verbose=false to omit triggered_rules and consolidated_duties when only
+    the decision is needed.
     """
     try:
         if not request.origin_country or not request.receiving_country:
             raise HTTPException(status_code=400, detail="origin_country and receiving_country are required")
 
-        # Detect health data
-        has_health_data_detected = False
-        health_detection_details = {}
-
-        if request.other_metadata:
-            health_detection_details = detect_health_data_from_metadata(request.other_metadata, verbose=True)
-            has_health_data_detected = health_detection_details['detected']
-
         has_pii = request.pii
+        origin = request.origin_country
+        receiving = request.receiving_country
 
-        logger.info(f"Evaluating: {request.origin_country} -> {request.receiving_country}, "
-                   f"PII={has_pii}, Health={has_health_data_detected}")
-
-        # Query triggered rules (includes country-specific check)
-        rules_result = query_triggered_rules_deontic(
-            request.origin_country.strip(),
-            request.receiving_country.strip(),
-            has_pii,
-            has_health_data_detected
-        )
+        # Health detection is memoised on the metadata and triggered rules per
+        # RulesGraph version; the rules result is shared, so it is only read below
+        has_health_data_detected, rules_result = await run_in_query_pool(_evaluate_triggered_rules, request)
 
         has_country_prohibition = rules_result.get('has_country_prohibition', False)
 
+        # One pass over the triggered rules collects the prohibition names
+        # each decision branch below reports
+        country_reasons = []
+        blocked_reasons = []
+        if has_country_prohibition or rules_result['has_prohibitions']:
+            for rule in rules_result['triggered_rules']:
+                prohibition = rule.get('prohibition')
+                if not prohibition:
+                    continue
+                if rule.get('is_country_specific'):
+                    country_reasons.append(prohibition['name'])
+                if rule.get('is_blocked'):
+                    blocked_reasons.append(prohibition['name'])
+
         # PRIORITY 1: Country-specific prohibition (overrides everything)
         if has_country_prohibition:
-            country_rules = [r for r in rules_result['triggered_rules'] if r.get('is_country_specific')]
-            prohibition_reasons = [r['prohibition']['name'] for r in country_rules if r.get('prohibition')]
+            prohibition_reasons = country_reasons
 
-            return {
+            return _evaluation_response(verbose, {
                 'success': True,
                 'transfer_status': 'PROHIBITED',
                 'transfer_blocked': True,
@@ -1503,14 +2353,13 @@ async def evaluate_rules(request: RulesEvaluationRequest):
                     'compliant': False,
                     'message': 'Blocked by country-specific prohibition (overrides assessments)'
                 }
-            }
+            })
 
         # PRIORITY 2: Other rule-level prohibitions
         if rules_result['has_prohibitions']:
-            prohibited_rules = [r for r in rules_result['triggered_rules'] if r.get('is_blocked')]
-            prohibition_reasons = [r['prohibition']['name'] for r in prohibited_rules if r.get('prohibition')]
+            prohibition_reasons = blocked_reasons
 
-            return {
+            return _evaluation_response(verbose, {
                 'success': True,
                 'transfer_status': 'PROHIBITED',
                 'transfer_blocked': True,
@@ -1530,27 +2379,17 @@ async def evaluate_rules(request: RulesEvaluationRequest):
                     'compliant': False,
                     'message': 'Blocked by prohibition rule'
                 }
-            }
+            })
+
+        # Required assessments come pre-classified from the permission duties
+        required_assessments = rules_result['required_assessments']
 
-        # Extract required assessments from permission rules
-        required_assessments = set()
-        for rule in rules_result['triggered_rules']:
-            if rule.get('permission') and rule['permission'].get('duties'):
-                for duty in rule['permission']['duties']:
-                    if duty.get('module'):
-                        if 'pia' in duty['module'].lower():
-                            required_assessments.add('PIA')
-                        elif 'tia' in duty['module'].lower():
-                            required_assessments.add('TIA')
-                        elif 'hrpr' in duty['module'].lower():
-                            required_assessments.add('HRPR')
-
-        required_assessments = list(required_assessments)
-
-        # PRIORITY 3-5: Validate against precedents
-        precedent_validation = validate_precedents(
-            origin=request.origin_country.strip(),
-            receiving=request.receiving_country.strip(),
+        # PRIORITY 3-5: Validate against precedents. This needs the required
+        # assessments above, so it runs after (not alongside) the rules query
+        precedent_validation = await run_in_query_pool(
+            validate_precedents,
+            origin=origin,
+            receiving=receiving,
             purposes=request.purpose_of_processing,
             process_l1=request.process_l1,
             process_l2=request.process_l2,
@@ -1583,7 +2422,7 @@ async def evaluate_rules(request: RulesEvaluationRequest):
             'required': required_assessments
         }
 
-        return {
+        return _evaluation_response(verbose, {
             'success': True,
             'transfer_status': transfer_status,
             'transfer_blocked': transfer_blocked,
@@ -1595,7 +2434,7 @@ async def evaluate_rules(request: RulesEvaluationRequest):
             'consolidated_duties': rules_result['consolidated_duties'],
             'precedent_validation': precedent_validation,
             'assessment_compliance': assessment_compliance
-        }
+        })
 
     except HTTPException:
         raise
@@ -1611,11 +2450,12 @@ async def search_cases(request: SearchCasesRequest):
     ONLY returns cases with valid status (Completed, Complete, Active, Published).
     """
     try:
-        origin = request.origin_country.strip() if request.origin_country else None
-        receiving = request.receiving_country.strip() if request.receiving_country else None
-        process_l1 = request.process_l1.strip() if request.process_l1 else None
-        process_l2 = request.process_l2.strip() if request.process_l2 else None
-        process_l3 = request.process_l3.strip() if request.process_l3 else None
+        # String fields arrive stripped (blank -> None) from the request model
+        origin = request.origin_country
+        receiving = request.receiving_country
+        process_l1 = request.process_l1
+        process_l2 = request.process_l2
+        process_l3 = request.process_l3
 
         has_pii_str = None
         if request.pii is True:
@@ -1623,15 +2463,24 @@ async def search_cases(request: SearchCasesRequest):
         elif request.pii is False:
             has_pii_str = 'no'
 
-        cases = search_data_graph(
+        # The response model needs the full list and its length; the rows
+        # are consumed on the query pool, where the generator runs its query
+        cases = await run_in_query_pool(list, search_data_graph(
             origin, receiving,
-            request.purpose_of_processing if request.purpose_of_processing else None,
+            request.purpose_of_processing,
             process_l1, process_l2, process_l3,
             has_pii_str
+        ))
+
+        if USE_ORJSON:
+            # Returned directly: orjson encodes the CaseRow dataclasses natively,
+            # skipping the per-row response-model pass
+            return ORJSONResponse(content={'success': True, 'cases': cases, 'total_cases': len(cases)})
+        return Response(
+            content=b'{"success":true,"cases":%s,"total_cases":%d}' % (_CASE_ROWS_ADAPTER.dump_json(cases), len(cases)),
+            media_type='application/json'
         )
 
-        return {'success': True, 'cases': cases, 'total_cases': len(cases)}
-
     except Exception as e:
         logger.error(f"Error searching cases: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1642,34 +2491,30 @@ async def get_stats():
     """Get dashboard statistics"""
     try:
         # Count only valid status cases
-        valid_statuses_str = ', '.join([f"'{s}'" for s in VALID_CASE_STATUSES])
-
-        query_cases = f"MATCH (c:Case) WHERE c.case_status IN [{valid_statuses_str}] RETURN count(c) as count"
-        result_cases = query_with_timeout(data_graph, query_cases, context="Count valid cases")
-        total_cases = result_cases.result_set[0][0] if result_cases.result_set else 0
+        status_params = {'valid_statuses': VALID_CASE_STATUSES_PARAM, 'pii_na_values': PII_NA_VALUES_PARAM}
 
-        query_all_cases = "MATCH (c:Case) RETURN count(c) as count"
-        result_all = query_with_timeout(data_graph, query_all_cases, context="Count all cases")
-        all_cases = result_all.result_set[0][0] if result_all.result_set else 0
-
-        query_countries = "MATCH (c:Country) RETURN count(c) as count"
-        result_countries = query_with_timeout(data_graph, query_countries, context="Count countries")
-        total_countries = result_countries.result_set[0][0] if result_countries.result_set else 0
-
-        query_jurisdictions = "MATCH (j:Jurisdiction) RETURN count(j) as count"
-        result_jurisdictions = query_with_timeout(data_graph, query_jurisdictions, context="Count jurisdictions")
-        total_jurisdictions = result_jurisdictions.result_set[0][0] if result_jurisdictions.result_set else 0
-
-        query_pii = f"""
-        MATCH (c:Case)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory)
-        WHERE c.case_status IN [{valid_statuses_str}]
-        AND pdc.name <> 'N/A' AND pdc.name <> 'NA' AND pdc.name <> 'null'
-        RETURN count(DISTINCT c) as count
+        # All five counts in one plan and one round-trip; each CALL returns a
+        # single row, so the subqueries don't multiply each other
+        query = """
+        CALL { MATCH (c:Case) WHERE c.case_status IN $valid_statuses RETURN count(c) AS total_cases }
+        CALL { MATCH (c:Case) RETURN count(c) AS all_cases }
+        CALL { MATCH (c:Country) RETURN count(c) AS total_countries }
+        CALL { MATCH (j:Jurisdiction) RETURN count(j) AS total_jurisdictions }
+        CALL {
+            MATCH (c:Case)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory)
+            WHERE c.case_status IN $valid_statuses
+            AND NOT toUpper(trim(pdc.name)) IN $pii_na_values
+            RETURN count(DISTINCT c) AS cases_with_pii
+        }
+        RETURN total_cases, all_cases, total_countries, total_jurisdictions, cases_with_pii
         """
-        result_pii = query_with_timeout(data_graph, query_pii, context="Count cases with PII")
-        cases_with_pii = result_pii.result_set[0][0] if result_pii.result_set else 0
+        result = await query_async(data_graph, query, params=status_params, context="Dashboard stats")
+        rows = result.result_set
+        total_cases, all_cases, total_countries, total_jurisdictions, cases_with_pii = (
+            rows[0] if rows else (0, 0, 0, 0, 0)
+        )
 
-        return {
+        return _json_response({
             'success': True,
             'stats': {
                 'total_cases': total_cases,
@@ -1678,7 +2523,7 @@ async def get_stats():
                 'total_jurisdictions': total_jurisdictions,
                 'cases_with_pii': cases_with_pii
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error fetching stats: {e}")
@@ -1689,48 +2534,47 @@ async def get_stats():
 async def get_all_dropdown_values():
     """Get all dropdown values in a single call"""
     try:
-        query_origin = "MATCH (c:Country) RETURN DISTINCT c.name as name ORDER BY name"
-        result_origin = query_with_timeout(data_graph, query_origin, context="Get all origin countries", use_cache=True, cache_key="all_origin")
-
-        query_receiving = "MATCH (j:Jurisdiction) RETURN DISTINCT j.name as name ORDER BY name"
-        result_receiving = query_with_timeout(data_graph, query_receiving, context="Get all receiving countries", use_cache=True, cache_key="all_receiving")
-
-        origin_countries = [row[0] for row in result_origin.result_set] if result_origin.result_set else []
-        receiving_countries = [row[0] for row in result_receiving.result_set] if result_receiving.result_set else []
-        all_countries = sorted(list(set(origin_countries + receiving_countries)))
-
-        query_purposes = "MATCH (p:Purpose) RETURN DISTINCT p.name as name ORDER BY name"
-        result_purposes = query_with_timeout(data_graph, query_purposes, context="Get all purposes", use_cache=True, cache_key="all_purposes")
-        purposes = [row[0] for row in result_purposes.result_set] if result_purposes.result_set else []
-
-        query_l1 = "MATCH (p:ProcessL1) RETURN DISTINCT p.name as name ORDER BY name"
-        result_l1 = query_with_timeout(data_graph, query_l1, context="Get all ProcessL1", use_cache=True, cache_key="all_l1")
-        process_l1 = [row[0] for row in result_l1.result_set] if result_l1.result_set else []
+        cached = get_cached_result("all_dropdown_bundle")
+        if cached is not None:
+            return _json_response(cached)
 
-        query_l2 = "MATCH (p:ProcessL2) RETURN DISTINCT p.name as name ORDER BY name"
-        result_l2 = query_with_timeout(data_graph, query_l2, context="Get all ProcessL2", use_cache=True, cache_key="all_l2")
-        process_l2 = [row[0] for row in result_l2.result_set] if result_l2.result_set else []
+        # One round-trip for every dropdown: each branch tags its names with
+        # the bucket they belong to
+        query = """
+        MATCH (c:Country) RETURN DISTINCT 'origin' AS k, c.name AS n
+        UNION ALL MATCH (j:Jurisdiction) RETURN DISTINCT 'receiving' AS k, j.name AS n
+        UNION ALL MATCH (p:Purpose) RETURN DISTINCT 'purposes' AS k, p.name AS n
+        UNION ALL MATCH (p:ProcessL1) RETURN DISTINCT 'process_l1' AS k, p.name AS n
+        UNION ALL MATCH (p:ProcessL2) RETURN DISTINCT 'process_l2' AS k, p.name AS n
+        UNION ALL MATCH (p:ProcessL3) RETURN DISTINCT 'process_l3' AS k, p.name AS n
+        UNION ALL MATCH (pdc:PersonalDataCategory) RETURN DISTINCT 'pdc' AS k, pdc.name AS n
+        """
+        result = await query_async(data_graph, query, context="Get all dropdown values")
 
-        query_l3 = "MATCH (p:ProcessL3) RETURN DISTINCT p.name as name ORDER BY name"
-        result_l3 = query_with_timeout(data_graph, query_l3, context="Get all ProcessL3", use_cache=True, cache_key="all_l3")
-        process_l3 = [row[0] for row in result_l3.result_set] if result_l3.result_set else []
+        buckets = defaultdict(list)
+        for k, n in result.result_set or ():
+            if n is not None:
+                buckets[k].append(n)
+        for names in buckets.values():
+            names.sort()
 
-        query_pdc = "MATCH (pdc:PersonalDataCategory) RETURN DISTINCT pdc.name as name ORDER BY name"
-        result_pdc = query_with_timeout(data_graph, query_pdc, context="Get all PersonalDataCategories", use_cache=True, cache_key="all_pdc")
-        personal_data_categories = [row[0] for row in result_pdc.result_set] if result_pdc.result_set else []
+        origin_countries = buckets['origin']
+        receiving_countries = buckets['receiving']
 
-        return {
+        dropdowns = {
             'success': True,
-            'countries': all_countries,
+            'countries': _merge_unique(origin_countries, receiving_countries),
             'origin_countries': origin_countries,
             'receiving_countries': receiving_countries,
-            'purposes': purposes,
-            'process_l1': process_l1,
-            'process_l2': process_l2,
-            'process_l3': process_l3,
-            'personal_data_categories': personal_data_categories,
-            'valid_case_statuses': VALID_CASE_STATUSES
+            'purposes': buckets['purposes'],
+            'process_l1': buckets['process_l1'],
+            'process_l2': buckets['process_l2'],
+            'process_l3': buckets['process_l3'],
+            'personal_data_categories': buckets['pdc'],
+            'valid_case_statuses': VALID_CASE_STATUSES_PARAM
         }
+        set_cached_result("all_dropdown_bundle", dropdowns)
+        return _json_response(dropdowns)
 
     except Exception as e:
         logger.error(f"Error fetching all dropdown values: {e}")
@@ -1739,7 +2583,16 @@ async def get_all_dropdown_values():
 
 @app.get("/api/test-rules-graph", tags=["Testing"])
 async def test_rules_graph():
-    """Test endpoint to verify RulesGraph is properly configured"""
+    """
+    Test endpoint to verify RulesGraph is properly configured.
+    The label counts are cached for RULES_GRAPH_STATS_TTL, so monitoring polls
+    don't rescan the graph; a rebuild clears them via the invalidate endpoint.
+    """
+    global _rules_graph_stats
+    cached = _rules_graph_stats
+    if cached is not None and time.time() - cached[0] < RULES_GRAPH_STATS_TTL:
+        return cached[1]
+
     try:
         query = """
         MATCH (cg:CountryGroup) WITH count(cg) as groups
@@ -1751,15 +2604,16 @@ async def test_rules_graph():
         MATCH (d:Duty) WITH groups, countries, rules, actions, permissions, prohibitions, count(d) as duties
         RETURN groups, countries, rules, actions, permissions, prohibitions, duties
         """
-        result = query_with_timeout(rules_graph, query, context="Test rules graph")
+        result = await query_async(rules_graph, query, context="Test rules graph")
 
-        if result.result_set:
-            groups, countries, rules, actions, permissions, prohibitions, duties = result.result_set[0]
+        rows = result.result_set
+        if rows:
+            groups, countries, rules, actions, permissions, prohibitions, duties = rows[0]
 
             # Add config-based prohibition count
             config_prohibitions = len(PROHIBITION_CONFIG.get('prohibition_rules', {})) if PROHIBITION_CONFIG else 0
 
-            return {
+            payload = {
                 'success': True,
                 'rules_graph_stats': {
                     'country_groups': groups,
@@ -1773,6 +2627,8 @@ async def test_rules_graph():
                 },
                 'message': 'Deontic RulesGraph is operational'
             }
+            _rules_graph_stats = (time.time(), payload)
+            return payload
         else:
             raise HTTPException(status_code=500, detail='RulesGraph is empty. Run build_rules_graph_deontic.py first.')
 
@@ -1781,15 +2637,27 @@ async def test_rules_graph():
         raise HTTPException(status_code=500, detail=f'RulesGraph may not be built. Run build_rules_graph_deontic.py. Error: {str(e)}')
 
 
+@app.post("/api/test-rules-graph/invalidate", tags=["Admin"])
+async def invalidate_rules_graph():
+    """Drop every RulesGraph-derived cache entry (called by build_rules_graph_deontic.py)"""
+    invalidate_rules_cache()
+    return {'success': True, 'message': 'RulesGraph caches invalidated'}
+
+
 @app.get("/api/cache/clear", tags=["Admin"])
 async def clear_cache():
     """Clear the query cache"""
-    global _query_cache, _cache_timestamps
-    _query_cache = {}
-    _cache_timestamps = {}
+    clear_cached_results()
+    invalidate_rules_cache()
     return {'success': True, 'message': 'Cache cleared'}
 
 
+@app.get("/api/cache/stats", tags=["Admin"])
+async def get_cache_stats():
+    """Query cache size and hit/miss counters since startup"""
+    return {'success': True, **cache_stats()}
+
+
 if __name__ == '__main__':
     import uvicorn
 
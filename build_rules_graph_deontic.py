@@ -32,11 +32,17 @@ Schema Conventions:
 from falkordb import FalkorDB
 import logging
 import json
+import os
+import sys
 from pathlib import Path
+import urllib.request
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Running API, told to drop its RulesGraph caches after a rebuild
+API_BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:5001")
+
 
 def load_prohibition_rules_config():
     """Load prohibition rules configuration from JSON file"""
@@ -899,6 +905,20 @@ def test_deontic_graph():
     logger.info("="*70)
 
 
+def notify_api_rules_rebuilt() -> bool:
+    """Ask the running API to invalidate its RulesGraph caches; False if that failed"""
+    request = urllib.request.Request(f"{API_BASE_URL}/api/test-rules-graph/invalidate", method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=5):
+            logger.info(f"✓ API RulesGraph caches invalidated at {API_BASE_URL}")
+        return True
+    except OSError as e:
+        logger.error(f"❌ Could not invalidate API RulesGraph caches at {API_BASE_URL}: {e}")
+        logger.error("   A running API may serve the previous rules until its cache TTL expires; "
+                     "set API_BASE_URL, call POST /api/test-rules-graph/invalidate, or restart it")
+        return False
+
+
 if __name__ == '__main__':
     print("="*70)
     print("BUILDING DEONTIC RULES GRAPH IN FALKORDB")
@@ -906,6 +926,7 @@ if __name__ == '__main__':
     print()
 
     build_rules_graph_deontic()
+    api_notified = notify_api_rules_rebuilt()
 
     print()
     print("="*70)
@@ -915,3 +936,6 @@ if __name__ == '__main__':
     print()
 
     test_deontic_graph()
+
+    if not api_notified:
+        sys.exit(1)
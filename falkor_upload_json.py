@@ -37,6 +37,7 @@ JSON Format:
 """
 
 import json
+import re
 import sys
 from pathlib import Path
 from falkordb import FalkorDB
@@ -47,6 +48,26 @@ import time
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Personal data category values that mean "no PII" (upper-cased, trimmed);
+# must match PII_NA_VALUES in api_fastapi_deontic.py
+PII_NA_VALUES = frozenset(['N/A', 'NA', 'NULL', ''])
+
+# Lower-cased health keywords from the API's health_data_config.json. Without
+# the config has_health_data is left unset and the API classifies at query time
+HEALTH_CONFIG_PATH = Path(__file__).parent / "health_data_config.json"
+if HEALTH_CONFIG_PATH.exists():
+    with open(HEALTH_CONFIG_PATH, 'r', encoding='utf-8') as f:
+        HEALTH_KEYWORDS = tuple(dict.fromkeys(
+            k.lower() for k in json.load(f)['detection_rules']['keywords']
+        ))
+else:
+    HEALTH_KEYWORDS = None
+
+# Whole-word keyword match, the same \b rule as HEALTH_KEYWORDS_RE in the API
+HEALTH_KEYWORDS_RE = (
+    re.compile(r'\b(?:' + '|'.join(map(re.escape, HEALTH_KEYWORDS)) + r')\b') if HEALTH_KEYWORDS else None
+)
+
 
 def parse_pipe_separated(value: str) -> list:
     """
@@ -106,6 +127,21 @@ def parse_process_hierarchy(process_string: str) -> list:
     return hierarchies
 
 
+def classify_case(pd_list: list, pdc_list: list) -> tuple:
+    """
+    (has_pii, has_health_data) flags stored on the Case node, computed the same
+    way the API does: any real personal data category is PII, and any item
+    containing a health keyword as a whole word is health data (None without
+    the config)
+    """
+    has_pii = any(pdc.strip().upper() not in PII_NA_VALUES for pdc in pdc_list)
+    if HEALTH_KEYWORDS_RE is None:
+        return has_pii, None
+    joined = ' '.join(pd_list + pdc_list).lower()
+    has_health_data = HEALTH_KEYWORDS_RE.search(joined) is not None
+    return has_pii, has_health_data
+
+
 def create_optimized_indexes(graph):
     """Create comprehensive indexes for performance on large graphs"""
     logger.info("Creating optimized indexes...")
@@ -126,6 +162,9 @@ def create_optimized_indexes(graph):
         "CREATE INDEX FOR (c:Case) ON (c.pia_status)",
         "CREATE INDEX FOR (c:Case) ON (c.tia_status)",
         "CREATE INDEX FOR (c:Case) ON (c.hrpr_status)",
+        # Precomputed classification flags
+        "CREATE INDEX FOR (c:Case) ON (c.has_pii)",
+        "CREATE INDEX FOR (c:Case) ON (c.has_health_data)",
     ]
 
     created_count = 0
@@ -300,6 +339,26 @@ def load_case_batch(graph, cases, batch_start_num, total_cases):
         case_ref_id = case.get('caseRefId', case.get('case_ref_id', f'CASE-{case_num:06d}'))
 
         try:
+            # Personal data is parsed up front: the case's PII / health flags
+            # are stored on the Case node when it is created
+            pdc_str = case.get('personalDataCategory', case.get('personal_data_categories', ''))
+            if isinstance(pdc_str, str):
+                pdc_list = parse_pipe_separated(pdc_str)
+            elif isinstance(pdc_str, list):
+                pdc_list = pdc_str
+            else:
+                pdc_list = []
+
+            pd_str = case.get('personalData', case.get('personal_data', ''))
+            if isinstance(pd_str, str):
+                pd_list = parse_pipe_separated(pd_str)
+            elif isinstance(pd_str, list):
+                pd_list = pd_str
+            else:
+                pd_list = []
+
+            has_pii, has_health_data = classify_case(pd_list, pdc_list)
+
             # Create Case node
             case_query = """
             CREATE (c:Case {
@@ -308,7 +367,9 @@ def load_case_batch(graph, cases, batch_start_num, total_cases):
                 case_status: $case_status,
                 pia_status: $pia_status,
                 tia_status: $tia_status,
-                hrpr_status: $hrpr_status
+                hrpr_status: $hrpr_status,
+                has_pii: $has_pii,
+                has_health_data: $has_health_data
             })
             """
 
@@ -318,7 +379,9 @@ def load_case_batch(graph, cases, batch_start_num, total_cases):
                 'case_status': case.get('caseStatus', case.get('case_status', 'Active')),
                 'pia_status': case.get('piaStatus', case.get('pia_status', 'N/A')),
                 'tia_status': case.get('tiaStatus', case.get('tia_status', 'N/A')),
-                'hrpr_status': case.get('hrprStatus', case.get('hrpr_status', 'N/A'))
+                'hrpr_status': case.get('hrprStatus', case.get('hrpr_status', 'N/A')),
+                'has_pii': has_pii,
+                'has_health_data': has_health_data
             })
 
             # Create relationships - use optimized single query per relationship type
@@ -406,14 +469,6 @@ def load_case_batch(graph, cases, batch_start_num, total_cases):
                     """, params={'case_ref_id': case_ref_id, 'process_l3': l3.strip()})
 
             # Personal data category relationships
-            pdc_str = case.get('personalDataCategory', case.get('personal_data_categories', ''))
-            if isinstance(pdc_str, str):
-                pdc_list = parse_pipe_separated(pdc_str)
-            elif isinstance(pdc_str, list):
-                pdc_list = pdc_str
-            else:
-                pdc_list = []
-
             for pdc in pdc_list:
                 graph.query("""
                     MATCH (c:Case {case_ref_id: $case_ref_id})
@@ -422,14 +477,6 @@ def load_case_batch(graph, cases, batch_start_num, total_cases):
                 """, params={'case_ref_id': case_ref_id, 'pdc_name': pdc.strip()})
 
             # Personal data relationships
-            pd_str = case.get('personalData', case.get('personal_data', ''))
-            if isinstance(pd_str, str):
-                pd_list = parse_pipe_separated(pd_str)
-            elif isinstance(pd_str, list):
-                pd_list = pd_str
-            else:
-                pd_list = []
-
             for pd in pd_list:
                 graph.query("""
                     MATCH (c:Case {case_ref_id: $case_ref_id})
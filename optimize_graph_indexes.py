@@ -5,11 +5,52 @@ Supports 31k+ nodes and 1M+ edges
 """
 
 from falkordb import FalkorDB
+from pathlib import Path
+import json
 import logging
+import re
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Must match PII_NA_VALUES in api_fastapi_deontic.py
+PII_NA_VALUES = ['N/A', 'NA', 'NULL', '']
+HEALTH_CONFIG_PATH = Path(__file__).parent / "health_data_config.json"
+
+# Case PII flag, as set by falkor_upload_json.py at ingest
+PII_FLAG_BACKFILL = """
+    MATCH (c:Case) WHERE c.has_pii IS NULL
+    SET c.has_pii = size([(c)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory)
+                          WHERE NOT toUpper(trim(pdc.name)) IN $pii_na_values | pdc]) > 0
+"""
+
+# The health flag needs the API's whole-word keyword match, which Cypher can't
+# express: unflagged cases are read, classified here and written back in batches
+HEALTH_FLAG_CANDIDATES = """
+    MATCH (c:Case) WHERE c.has_health_data IS NULL
+    RETURN id(c),
+           [(c)-[:HAS_PERSONAL_DATA]->(pd:PersonalData) | pd.name] +
+           [(c)-[:HAS_PERSONAL_DATA_CATEGORY]->(pdc:PersonalDataCategory) | pdc.name]
+"""
+HEALTH_FLAG_UPDATE = """
+    UNWIND $flags AS f
+    MATCH (c:Case) WHERE id(c) = f.id
+    SET c.has_health_data = f.flag
+"""
+HEALTH_FLAG_BATCH_SIZE = 1000
+
+
+def backfill_health_flags(graph, keywords_re) -> int:
+    """Set has_health_data on unflagged cases with the \\b keyword rule of falkor_upload_json.py"""
+    result = graph.query(HEALTH_FLAG_CANDIDATES)
+    flags = [
+        {'id': case_id, 'flag': keywords_re.search(' '.join(filter(None, items)).lower()) is not None}
+        for case_id, items in result.result_set
+    ]
+    for start in range(0, len(flags), HEALTH_FLAG_BATCH_SIZE):
+        graph.query(HEALTH_FLAG_UPDATE, params={'flags': flags[start:start + HEALTH_FLAG_BATCH_SIZE]})
+    return len(flags)
+
 def create_all_indexes():
     """Create all necessary indexes for optimal query performance"""
 
@@ -31,6 +72,8 @@ def create_all_indexes():
         ("Case", "pia_status", "PIA status filtering"),
         ("Case", "tia_status", "TIA status filtering"),
         ("Case", "hrpr_status", "HRPR status filtering"),
+        ("Case", "has_pii", "PII flag filtering"),
+        ("Case", "has_health_data", "Health data flag filtering"),
 
         # Country and Jurisdiction indexes
         ("Country", "name", "Origin country lookup"),
@@ -49,6 +92,25 @@ def create_all_indexes():
         ("PersonalDataCategory", "name", "Personal data category lookup"),
     ]
 
+    # Backfill the precomputed PII / health flags on cases loaded before they existed
+    try:
+        graph.query(PII_FLAG_BACKFILL, params={'pii_na_values': PII_NA_VALUES})
+        logger.info("✅ Backfilled: Case.has_pii")
+    except Exception as e:
+        logger.error(f"❌ Failed to backfill Case.has_pii - {e}")
+
+    if HEALTH_CONFIG_PATH.exists():
+        with open(HEALTH_CONFIG_PATH, 'r', encoding='utf-8') as f:
+            health_keywords = {k.lower() for k in json.load(f)['detection_rules']['keywords']}
+        keywords_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, health_keywords)) + r')\b')
+        try:
+            flagged = backfill_health_flags(graph, keywords_re)
+            logger.info(f"✅ Backfilled: Case.has_health_data ({flagged} cases)")
+        except Exception as e:
+            logger.error(f"❌ Failed to backfill Case.has_health_data - {e}")
+    else:
+        logger.info("⏭️  Skipped: Case.has_health_data backfill (health_data_config.json not found)")
+
     created = 0
     already_exists = 0
     failed = 0